@@ -1,6 +1,12 @@
+import bisect
+import contextlib
+import dataclasses
+import functools
+import heapq
 import json
 import logging
 import math
+import operator
 import sys
 import typing
 import tkinter as tk
@@ -10,11 +16,15 @@ import os
 from datetime import datetime
 
 from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.worksheet.cell_range import MultiCellRange
 from openpyxl.utils import get_column_letter
 
 
 class Tooltip:
+    __slots__ = ("widget", "text_getter", "tipwindow")
+
     def __init__(self, widget: tk.Widget, text_getter: typing.Callable[[], str]) -> None:
         self.widget = widget
         self.text_getter = text_getter
@@ -62,6 +72,111 @@ logging.basicConfig(
     format="%(asctime)s %(levelname)s %(message)s",
 )
 
+try:
+    # Optional backend for very large exports, see CableCalcApp._write_workbook_xlsxwriter.
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: typing.Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: typing.Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+# Excel export styles. openpyxl styles are immutable, so one shared instance is
+# reused for every cell instead of being rebuilt on each export.
+_THIN_SIDE = Side(style="thin")
+_THIN_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+_HEADER_FILL = PatternFill(start_color="FFE0E0E0", end_color="FFE0E0E0", fill_type="solid")
+_HEADER_FONT = Font(bold=True)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+_TITLE_FONT = Font(bold=True, size=14)
+_TITLE_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+_SECTION_FONT = Font(bold=True, size=11)
+_DATE_FONT = Font(italic=True)
+_NOTE_FONT = Font(size=9)
+_NOTE_ALIGNMENT = Alignment(wrap_text=True)
+# Data cells reference a named style registered once per workbook; assigning it by
+# name is cheaper than setting the border on every cell.
+_DATA_CELL_STYLE = "data_cell"
+
+if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+    _BASE_DIR = sys._MEIPASS
+else:
+    _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_BASE_DIR, "data")
+
+
+def _sin_phi(cos_phi: float) -> float:
+    return math.sqrt(max(0.0, 1.0 - min(1.0, cos_phi) ** 2))
+
+
+def _voltage_drop_pct(
+    phase: float,
+    icalc_total: float,
+    r_per_km: float,
+    x_per_km: float,
+    n_parallel: int,
+    cos_phi: float,
+    sin_phi: float,
+    length_m: float,
+    voltage: float,
+) -> float:
+    """ΔU % of a line from plain floats; shared by the result panel and the candidate searches."""
+    divider = max(n_parallel, 1)
+    r_per_meter = (r_per_km / 1000.0) / divider
+    x_per_meter = (x_per_km / 1000.0) / divider
+    return phase * icalc_total * (r_per_meter * cos_phi + x_per_meter * sin_phi) * length_m * 100.0 / voltage
+
+
+def _interpolate(x: float, lower: float, upper: float, lower_val: float, upper_val: float) -> float:
+    """Linear interpolation inside one table bracket; a degenerate bracket yields the lower value."""
+    if math.isclose(upper, lower):
+        return lower_val
+    ratio = (x - lower) / (upper - lower)
+    return lower_val + ratio * (upper_val - lower_val)
+
+
+@dataclasses.dataclass(slots=True)
+class _CalcResult:
+    """Values of the last complete recalculation, written into a table row by add_row."""
+
+    pj: float
+    s_coeff: float
+    t_coeff: float
+    icalc_total: float
+    r_per_km: float | None
+    sigma: float | None
+    iz_one: float | None
+    delta_u: float
+    ampacity_ok: str
+    drop_ok: str | None
+    protection_status: str
+    i2_value: float | None
+    in_value: float | None
+    k_value: float | None
+    compatibility_status: str
+
+
+def _cell_width(value: typing.Any) -> int:
+    """Excel column width that fits value, capped at 50 characters."""
+    return min(len(str(value)) + 2, 50)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_fixed(value: float, digits: int, decimal_comma: bool) -> str:
+    formatted = f"{value:.{digits}f}"
+    return formatted.replace(".", ",") if decimal_comma else formatted
+
 
 class CableCalcApp(tk.Tk):
     WINDOW_TITLE_KEY = "app.title"
@@ -82,6 +197,20 @@ class CableCalcApp(tk.Tk):
     DEFAULT_MEDIUM = "air"
     DEFAULT_INSTALLATION_METHOD = "C"
 
+    LOADED_CORE_CHOICES = ("2", "3")
+    GROUP_COUNT_CHOICES = tuple(str(i) for i in range(1, 21))
+    PARALLEL_CHOICES = tuple(str(i) for i in range(1, 7))
+
+    # Form values derived from other inputs; they are not traced for recalculation.
+    DERIVED_FORM_FIELDS = frozenset({"Pj", "S", "T"})
+    # Numeric form fields normalized through float() when a table row is loaded back.
+    NUMERIC_FORM_FIELDS = frozenset({"Pi, W", "Kj", "η", "cos φ", "Dužina L, m"})
+    DECIMAL_COMMA_LANGUAGES = frozenset({"ru", "sr"})
+    EMPTY_CELL_TEXTS = frozenset({"", "—"})
+    # Besides digits, the characters _try_parse_float accepts at the start of a number: signs, a decimal
+    # point or comma, and the first letters of "inf" and "nan".
+    FLOAT_START_CHARS = frozenset("+-.,iInN")
+
     LABEL_KEY_MAP = {
         CIRCUIT_KEY: "label.circuit",
         "Deonica OD": "label.segment_from",
@@ -209,16 +338,16 @@ class CableCalcApp(tk.Tk):
     TRANSLATIONS: dict[str, dict[str, str]] = {}
     TOOLTIPS: dict[str, dict[str, str]] = {}
     HELP_TEXTS: dict[str, str] = {}
-    INSULATION_OPTIONS: list[str] = []
+    INSULATION_OPTIONS: tuple[str, ...] = ()
     INSULATION_META: dict[str, dict[str, typing.Any]] = {}
-    CONDUCTOR_TYPES: list[str] = []
-    VOLTAGE_LEVELS: list[str] = []
+    CONDUCTOR_TYPES: tuple[str, ...] = ()
+    VOLTAGE_LEVELS: tuple[str, ...] = ()
     TEMPERATURE_MEDIA: dict[str, dict[str, str]] = {}
-    INSTALLATION_METHODS: list[str] = []
-    STANDARD_SECTIONS: list[float] = []
-    METHOD_PREFERENCE: list[str] = []
-    STANDARD_CROSS_SECTIONS: list[str] = []
-    STANDARD_BREAKER_RATINGS: list[str] = []
+    INSTALLATION_METHODS: tuple[str, ...] = ()
+    STANDARD_SECTIONS: tuple[float, ...] = ()
+    METHOD_PREFERENCE: tuple[str, ...] = ()
+    STANDARD_CROSS_SECTIONS: tuple[str, ...] = ()
+    STANDARD_BREAKER_RATINGS: tuple[str, ...] = ()
     DROP_LIMIT_KEYS: dict[str, float] = {}
     RESISTIVITY_20: dict[str, float] = {}
     TEMP_COEFF: dict[str, float] = {}
@@ -267,6 +396,40 @@ class CableCalcApp(tk.Tk):
         "Ключ",
         "Совместимость IEC",
     )
+    TREE_COLUMN_INDEX = {column: index for index, column in enumerate(TREE_COLUMNS)}
+    # Pulls a row dict's cells out in TREE_COLUMNS order in one C-level call.
+    TREE_ROW_VALUES = operator.itemgetter(*TREE_COLUMNS)
+    # Form field -> table column, used when a table row is loaded back into the form.
+    ROW_FIELD_MAP = {
+        "Strujni krug": "Strujni krug",
+        "Deonica OD": "OD",
+        "Deonica DO": "DO",
+        "Tip-IZOLACIJE": "E",
+        "Tip-PROVODNIKA": "F",
+        "Oznaka-tip-KABLA": "G",
+        "Pi, W": "Pi",
+        "Kj": "Kj",
+        "η": "η",
+        "U": "U",
+        "cos φ": "cosφ",
+        "Dužina L, m": "L",
+        "Presek, mm²": "Presek",
+        "Način polaganja": "Način polaganja",
+        "Нагруженные жилы (nž)": "nž",
+        "Кабелей в группе (для S)": "Кабелей в группе (S)",
+        "Параллельные кабели (n∥)": "n∥",
+        "In, A": "In [A]",
+        "k": "k",
+        "Ключ ΔU": "Ключ",
+    }
+    # Normalized table fields read by the ΔU aggregations, stored column-wise beside _table_data.
+    CHAIN_COLUMNS = ("circuit", "od", "do", "length", "area", "drop")
+    IMPEDANCE_CACHE_SIZE = 1024
+    SQRT3 = math.sqrt(3.0)
+    # From this many table rows the export switches to xlsxwriter's constant-memory writer, if installed.
+    XLSXWRITER_MIN_ROWS = 5000
+    # Two bits per check in the compatibility code: "OK" -> 0, "NE" -> 1, anything else -> 2.
+    STATUS_CODES = {"OK": 0, "NE": 1}
 
     def __init__(self) -> None:
         super().__init__()
@@ -275,9 +438,17 @@ class CableCalcApp(tk.Tk):
         self._language = tk.StringVar(value=self.DEFAULT_LANGUAGE)
         self._language.trace_add("write", self._on_language_change)
 
-        self._text_bindings: list[tuple[typing.Callable[[str], None], str]] = []
+        self._active_lang = self.DEFAULT_LANGUAGE
+        self._active_translations: dict[str, str] = {}
+        self._active_formatters: dict[str, typing.Callable[..., str]] = {}
+        self._active_tooltips: dict[str, str] = {}
+
+        # translation key -> setters / widgets showing that text
+        self._text_bindings: dict[str, list[typing.Callable[[str], None]]] = {}
+        self._widget_text_bindings: dict[str, list[tk.Widget]] = {}
         self._menu_text_bindings: list[tuple[tk.Menu, int, str]] = []
         self._tree_heading_bindings: list[tuple[str, str]] = []
+        self._applied_texts: dict[str, str] = {}
 
         self.style = ttk.Style(self)
         try:
@@ -306,10 +477,36 @@ class CableCalcApp(tk.Tk):
         self._form_values: dict[str, tk.Variable] = {}
         self._input_widgets: dict[str, ttk.Widget] = {}
         self._input_styles: dict[str, str] = {}
-        self._combobox_values: dict[str, list[str]] = {}
+        self._input_alert_styles: dict[str, str] = {}
+        # Last ttk style configured on each input and result widget, to skip repeated configure calls.
+        self._applied_styles: dict[tk.Widget, str] = {}
+        self._combobox_values: dict[str, tuple[str, ...]] = {}
         self._intermediate_vars: dict[str, tk.StringVar] = {}
+        self._intermediate_shown: dict[str, str] = {}
         self._intermediate_labels: dict[str, ttk.Label] = {}
-        self._table_data: list[dict[str, str]] = []
+        # One tuple of cell texts per table row, aligned with TREE_COLUMNS.
+        self._table_data: list[tuple[str, ...]] = []
+        # Excel cell values per row: numbers parsed once from the displayed text, other text as is.
+        self._table_cells: list[tuple[typing.Any, ...]] = []
+        # Widest Excel column width any data cell asks for, per column. Appends widen it in place; a delete
+        # can only shrink it, so it is just marked stale and recomputed once at export.
+        self._table_col_widths: list[int] = [0] * len(self.TREE_COLUMNS)
+        self._table_col_widths_stale = False
+        self._chain_columns: dict[str, list[typing.Any]] = {name: [] for name in self.CHAIN_COLUMNS}
+        # (circuit, DO) -> row indices in table order, so the chain walk jumps straight to candidates
+        self._idx_by_do: dict[tuple[str, str], list[int]] = {}
+        self._table_revision = 0
+        self._ampacity_sections: dict[str, tuple[float, ...]] = {}
+        # (insulation, conductor, laying, loaded cores) -> ampacity per STANDARD_SECTIONS entry
+        self._ampacity_rows: dict[tuple[str, str, str, int], tuple[float | None, ...]] = {}
+        self._temperature_points: dict[tuple[str, str], tuple[int, ...]] = {}
+        self._grouping_max: tuple[int, float] | None = None
+        self._last_rec_key: tuple[typing.Any, ...] | None = None
+        self._last_rec_result: list[str] = []
+        self._export_label_cache: dict[str, tuple[list[str], list[str]]] = {}
+        # (laying, section bucket) -> reactance after the buckets/method_defaults/default fallback
+        self._reactance_lut: dict[tuple[str, str], float] = {}
+        self._impedance_cache: dict[tuple[str, float, float, str], tuple[float, float]] = {}
         self._last_temperature_warning: tuple[str, str, float] | None = None
         self._temperature_editing = False
         self._tooltips: list["Tooltip"] = []
@@ -322,17 +519,24 @@ class CableCalcApp(tk.Tk):
         else:
             self._medium_selected_key = self.DEFAULT_MEDIUM
         self._medium_combobox: ttk.Combobox | None = None
+        # form label -> {display text in any language: internal value}
+        self._combo_display_to_value: dict[str, dict[str, str]] = {}
         self._help_text_widget: tk.Text | None = None
+        self._help_dirty = True
         self._notebook: ttk.Notebook | None = None
         self._tabs: dict[str, ttk.Frame] = {}
         self._last_icalc: float | None = None
-        self._last_result: dict[str, typing.Any] | None = None
+        self._last_result: _CalcResult | None = None
         self._voltage_phase_warning_shown = False
         self._loading_project = False
-        self._loading_row_into_form = False
+        self._traces_suspended = False
+        self._update_pending = False
+        self._input_vars: tuple[tk.StringVar, ...] = ()
+        self._last_input_sig: tuple[typing.Any, ...] | None = None
 
         # Load external resources (translations, tooltips, numeric tables)
         self._load_external_resources()
+        self._refresh_active_language()
 
         self._build_menu()
         self._build_layout()
@@ -341,32 +545,70 @@ class CableCalcApp(tk.Tk):
         self._apply_language()
 
     def _(self, key: str) -> str:
-        translations = self.TRANSLATIONS.get(key)
-        if not translations:
-            return key
+        return self._active_translations.get(key, key)
+
+    def _refresh_active_language(self) -> None:
+        """Flatten translations and tooltips for the selected language into plain dicts."""
         language = self._language.get()
-        if language in translations:
-            return translations[language]
-        default_value = translations.get(self.DEFAULT_LANGUAGE)
-        if default_value is not None:
-            return default_value
-        return next(iter(translations.values()))
+        default = self.DEFAULT_LANGUAGE
+        translations: dict[str, str] = {}
+        for key, values in self.TRANSLATIONS.items():
+            if not values:
+                continue
+            if language in values:
+                translations[key] = values[language]
+            elif default in values:
+                translations[key] = values[default]
+            else:
+                translations[key] = next(iter(values.values()))
+        self._active_lang = language
+        self._active_translations = translations
+        # Only templates with placeholders need formatting; _m returns the rest as is.
+        self._active_formatters = {key: text.format for key, text in translations.items() if "{" in text}
+        self._active_tooltips = {
+            key: values[language] if language in values else values.get(default, "")
+            for key, values in self.TOOLTIPS.items()
+        }
 
     def _m(self, key: str, *args: object) -> str:
         """Return translated string with format placeholders {0}, {1}, ... filled."""
-        return self._(key).format(*args)
+        formatter = self._active_formatters.get(key)
+        if formatter is None:
+            return self._(key)
+        return formatter(*args)
 
     def _bind_text(self, setter: typing.Callable[[str], None], key: str) -> None:
-        self._text_bindings.append((setter, key))
-        setter(self._(key))
+        self._text_bindings.setdefault(key, []).append(setter)
+        text = self._applied_texts[key] = self._(key)
+        setter(text)
+
+    def _bind_widget_text(self, widget: tk.Widget, key: str) -> None:
+        self._widget_text_bindings.setdefault(key, []).append(widget)
+        text = self._applied_texts[key] = self._(key)
+        widget.configure(text=text)
 
     def _register_menu_text(self, menu: tk.Menu, index: int, key: str) -> None:
         self._menu_text_bindings.append((menu, index, key))
-        menu.entryconfigure(index, label=self._(key))
+        text = self._applied_texts[key] = self._(key)
+        menu.entryconfigure(index, label=text)
 
-    def _register_tree_heading(self, column_id: str, key: str) -> None:
+    def _register_tree_heading(self, column_id: str, key: str) -> str:
         self._tree_heading_bindings.append((column_id, key))
-        self.tree.heading(column_id, text=self._(key))
+        text = self._applied_texts[key] = self._(key)
+        return text
+
+    # Tcl lambda that sets several Treeview headings in one interpreter call. Column ids
+    # and texts arrive as list elements, so brackets or spaces in them need no quoting.
+    _TREE_HEADINGS_SCRIPT = "{tree pairs} {foreach {col text} $pairs {$tree heading $col -text $text}}"
+
+    def _set_tree_headings(self, headings: list[tuple[str, str]]) -> None:
+        if not headings:
+            return
+        pairs = tuple(item for heading in headings for item in heading)
+        try:
+            self.tk.call("apply", self._TREE_HEADINGS_SCRIPT, str(self.tree), pairs)
+        except tk.TclError as e:
+            logging.error("Tree heading update failed: %s", e)
 
     def _register_notebook_tab(self, tab: ttk.Frame, key: str) -> None:
         if not self._notebook:
@@ -379,41 +621,51 @@ class CableCalcApp(tk.Tk):
         self._bind_text(setter, key)
 
     def _on_language_change(self, *_: object) -> None:
+        self._refresh_active_language()
         self._apply_language()
 
     def _apply_language(self) -> None:
         self.title(self._(self.WINDOW_TITLE_KEY))
 
-        for setter, key in self._text_bindings:
-            setter(self._(key))
+        # Only push texts whose translation differs from what the widgets already
+        # show; every configure is a separate Tcl call.
+        previous = self._applied_texts
+        current = {key: self._(key) for key in previous}
+        changed = {key for key, text in current.items() if previous[key] != text}
+        self._applied_texts = current
+
+        for key in changed:
+            text = current[key]
+            for widget in self._widget_text_bindings.get(key, ()):
+                widget.configure(text=text)
+            for setter in self._text_bindings.get(key, ()):
+                setter(text)
 
         for menu, index, key in self._menu_text_bindings:
+            if key not in changed:
+                continue
             try:
-                menu.entryconfigure(index, label=self._(key))
+                menu.entryconfigure(index, label=current[key])
             except tk.TclError:
                 continue
 
         if hasattr(self, "tree"):
-            for column_id, key in self._tree_heading_bindings:
-                try:
-                    self.tree.heading(column_id, text=self._(key))
-                except tk.TclError:
-                    continue
+            self._set_tree_headings(
+                [(column_id, current[key]) for column_id, key in self._tree_heading_bindings if key in changed]
+            )
 
         self._update_medium_options()
-        self._update_help_text()
+        self._help_dirty = True
+        if self._help_tab_visible():
+            self._update_help_text()
 
     def _resource_path(self, *parts: str) -> str:
-        if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-            base = sys._MEIPASS
-        else:
-            base = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(base, "data", *parts)
+        return os.path.join(_DATA_DIR, *parts)
 
     def _load_json_file(self, rel_path: str) -> typing.Any:
         try:
-            with open(self._resource_path(rel_path), "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self._resource_path(rel_path), "rb") as f:
+                return _json_loads(f.read())
         except OSError:
             return None
         except json.JSONDecodeError:
@@ -428,58 +680,51 @@ class CableCalcApp(tk.Tk):
         tooltips = self._load_json_file("tooltips.json")
         if isinstance(tooltips, dict):
             self.TOOLTIPS = tooltips
-        # Help texts
-        helps: dict[str, str] = {}
-        for code in ("ru", "sr", "en"):
-            try:
-                with open(self._resource_path("help", f"{code}.txt"), "r", encoding="utf-8") as f:
-                    helps[code] = f.read()
-            except OSError:
-                continue
-        if helps:
-            self.HELP_TEXTS = helps
+        # Help texts are read on demand by _get_help_text
+        self.HELP_TEXTS = {}
 
         # Tables and numeric data
+        self._ampacity_sections.clear()
+        self._ampacity_rows.clear()
+        self._temperature_points.clear()
+        self._grouping_max = None
+        self._reactance_lut.clear()
+        self._last_rec_key = None
+        self._last_input_sig = None
+        self._export_label_cache.clear()
+        self._impedance_cache.clear()
         tables = self._load_json_file("tables.json")
         if not isinstance(tables, dict):
             return
-        self.INSULATION_OPTIONS = tables.get("INSULATION_OPTIONS", [])
+        self.INSULATION_OPTIONS = tuple(tables.get("INSULATION_OPTIONS", ()))
         self.INSULATION_META = tables.get("INSULATION_META", {})
-        self.CONDUCTOR_TYPES = tables.get("CONDUCTOR_TYPES", [])
-        self.VOLTAGE_LEVELS = tables.get("VOLTAGE_LEVELS", [])
+        self.CONDUCTOR_TYPES = tuple(tables.get("CONDUCTOR_TYPES", ()))
+        self.VOLTAGE_LEVELS = tuple(tables.get("VOLTAGE_LEVELS", ()))
         self.TEMPERATURE_MEDIA = tables.get("TEMPERATURE_MEDIA", {})
-        self.INSTALLATION_METHODS = tables.get("INSTALLATION_METHODS", [])
-        self.STANDARD_SECTIONS = tables.get("STANDARD_SECTIONS", [])
-        self.METHOD_PREFERENCE = tables.get("METHOD_PREFERENCE", [])
-        self.STANDARD_CROSS_SECTIONS = tables.get("STANDARD_CROSS_SECTIONS", [])
-        self.STANDARD_BREAKER_RATINGS = tables.get("STANDARD_BREAKER_RATINGS", [])
+        medium_lookup: dict[str, str] = {}
+        for medium_key, translations in self.TEMPERATURE_MEDIA.items():
+            for display in translations.values():
+                medium_lookup.setdefault(display, medium_key)
+        self._combo_display_to_value["Среда для Т"] = medium_lookup
+        self.INSTALLATION_METHODS = tuple(tables.get("INSTALLATION_METHODS", ()))
+        # Kept ascending: the first entry is the smallest section and _recommend bisects into it.
+        self.STANDARD_SECTIONS = tuple(sorted(tables.get("STANDARD_SECTIONS", ())))
+        self.METHOD_PREFERENCE = tuple(tables.get("METHOD_PREFERENCE", ()))
+        self.STANDARD_CROSS_SECTIONS = tuple(tables.get("STANDARD_CROSS_SECTIONS", ()))
+        self.STANDARD_BREAKER_RATINGS = tuple(tables.get("STANDARD_BREAKER_RATINGS", ()))
         self.DROP_LIMIT_KEYS = tables.get("DROP_LIMIT_KEYS", {})
         self.RESISTIVITY_20 = tables.get("RESISTIVITY_20", {})
         self.TEMP_COEFF = tables.get("TEMP_COEFF", {})
         self.REACTANCE_DATA = tables.get("REACTANCE", {})
 
         # Convert dicts that require numeric keys
-        amp_base_raw = tables.get("AMPACITY_BASE", {})
-        amp_base: dict[str, dict[float, float]] = {}
-        for m, inner in amp_base_raw.items():
-            try:
-                amp_base[m] = {float(k): float(v) for k, v in inner.items()}
-            except (ValueError, TypeError) as e:
-                logging.warning("AMPACITY_BASE: skip method %s: %s", m, e)
-                continue
+        amp_base = self._coerce_nested(tables.get("AMPACITY_BASE", {}), float, "AMPACITY_BASE")
         if amp_base:
             self.AMPACITY_BASE = amp_base
 
         self.AMPACITY_INSULATION_FACTORS = tables.get("AMPACITY_INSULATION_FACTORS", {})
 
-        loaded_raw = tables.get("AMPACITY_LOADED_FACTORS", {})
-        loaded: dict[str, dict[int, float]] = {}
-        for m, inner in loaded_raw.items():
-            try:
-                loaded[m] = {int(k): float(v) for k, v in inner.items()}
-            except (ValueError, TypeError) as e:
-                logging.warning("AMPACITY_LOADED_FACTORS: skip method %s: %s", m, e)
-                continue
+        loaded = self._coerce_nested(tables.get("AMPACITY_LOADED_FACTORS", {}), int, "AMPACITY_LOADED_FACTORS")
         if loaded:
             self.AMPACITY_LOADED_FACTORS = loaded
 
@@ -489,33 +734,32 @@ class CableCalcApp(tk.Tk):
         except (ValueError, TypeError) as e:
             logging.warning("GROUPING_FACTORS load failed: %s", e)
 
-        ktv_raw = tables.get("KT_V_TABLE", {})
-        ktv: dict[str, dict[int, float]] = {}
-        for ins, inner in ktv_raw.items():
-            try:
-                ktv[ins] = {int(k): float(v) for k, v in inner.items()}
-            except (ValueError, TypeError) as e:
-                logging.warning("KT_V_TABLE: skip insulation %s: %s", ins, e)
-                continue
+        ktv = self._coerce_nested(tables.get("KT_V_TABLE", {}), int, "KT_V_TABLE")
         if ktv:
             self.KT_V_TABLE = ktv
 
-        ktz_raw = tables.get("KT_Z_TABLE", {})
-        ktz: dict[str, dict[int, float]] = {}
-        for ins, inner in ktz_raw.items():
-            try:
-                ktz[ins] = {int(k): float(v) for k, v in inner.items()}
-            except (ValueError, TypeError) as e:
-                logging.warning("KT_Z_TABLE: skip insulation %s: %s", ins, e)
-                continue
+        ktz = self._coerce_nested(tables.get("KT_Z_TABLE", {}), int, "KT_Z_TABLE")
         if ktz:
             self.KT_Z_TABLE = ktz
 
+    @staticmethod
+    def _coerce_nested(
+        raw: dict[str, typing.Any], key_type: typing.Callable[[str], typing.Any], name: str
+    ) -> dict[str, dict[typing.Any, float]]:
+        """Convert {outer: {key: value}} JSON tables to numeric keys and float values, skipping bad entries."""
+        result: dict[str, dict[typing.Any, float]] = {}
+        for outer, inner in raw.items():
+            try:
+                result[outer] = {key_type(k): float(v) for k, v in inner.items()}
+            except (ValueError, TypeError) as e:
+                logging.warning("%s: skip %s: %s", name, outer, e)
+        return result
+
     def _update_medium_options(self) -> None:
         if not self._medium_combobox:
             return
-        language = self._language.get()
-        values = [meta.get(language, meta.get(self.DEFAULT_LANGUAGE, "")) for meta in self.TEMPERATURE_MEDIA.values()]
+        language = self._active_lang
+        values = tuple(meta.get(language, meta.get(self.DEFAULT_LANGUAGE, "")) for meta in self.TEMPERATURE_MEDIA.values())
         self._medium_combobox.configure(values=values)
         self._combobox_values["Среда для Т"] = values
         display = self.TEMPERATURE_MEDIA[self._medium_selected_key].get(
@@ -526,34 +770,40 @@ class CableCalcApp(tk.Tk):
         if var is not None:
             var.set(display)
 
+    def _get_help_text(self, language: str) -> str:
+        if language not in self.HELP_TEXTS:
+            try:
+                with open(self._resource_path("help", f"{language}.txt"), "r", encoding="utf-8") as f:
+                    self.HELP_TEXTS[language] = f.read()
+            except OSError:
+                if language != self.DEFAULT_LANGUAGE:
+                    return self._get_help_text(self.DEFAULT_LANGUAGE)
+                return ""
+        return self.HELP_TEXTS[language]
+
     def _update_help_text(self) -> None:
         if self._help_text_widget is None:
             return
-        language = self._language.get()
-        help_text = self.HELP_TEXTS.get(language, self.HELP_TEXTS[self.DEFAULT_LANGUAGE])
+        help_text = self._get_help_text(self._active_lang)
         self._help_text_widget.configure(state="normal")
         self._help_text_widget.delete("1.0", tk.END)
         self._help_text_widget.insert("1.0", help_text)
         self._help_text_widget.configure(state="disabled")
+        self._help_dirty = False
+
+    def _combo_value(self, label: str, display: str, default: str) -> str:
+        return self._combo_display_to_value.get(label, {}).get(display.strip(), default)
 
     def _on_medium_changed(self, _: tk.Event | None) -> None:
         display = self._form_values.get("Среда для Т")
         if display is None:
             return
-        selected = display.get().strip()
-        for key, translations in self.TEMPERATURE_MEDIA.items():
-            if selected in translations.values():
-                self._medium_selected_key = key
-                break
-        self._update_intermediate_results()
+        self._medium_selected_key = self._combo_value("Среда для Т", display.get(), self._medium_selected_key)
+        self._schedule_intermediate_update()
 
     def _set_medium_from_value(self, value: str) -> None:
-        normalized = value.strip()
-        for key, translations in self.TEMPERATURE_MEDIA.items():
-            if normalized in translations.values():
-                self._medium_selected_key = key
-                break
-        language = self._language.get()
+        self._medium_selected_key = self._combo_value("Среда для Т", value, self._medium_selected_key)
+        language = self._active_lang
         display = self.TEMPERATURE_MEDIA[self._medium_selected_key].get(
             language, self.TEMPERATURE_MEDIA[self._medium_selected_key][self.DEFAULT_LANGUAGE]
         )
@@ -567,17 +817,12 @@ class CableCalcApp(tk.Tk):
         tooltip_texts = self.TOOLTIPS.get(label_key)
         if not tooltip_texts:
             return
-
-        def text_getter(key: str = label_key) -> str:
-            translations = self.TOOLTIPS.get(key, {})
-            language = self._language.get()
-            if language in translations:
-                return translations[language]
-            return translations.get(self.DEFAULT_LANGUAGE, "")
-
-        tooltip = Tooltip(widget, text_getter)
+        tooltip = Tooltip(widget, functools.partial(self._tooltip_text, label_key))
         self._tooltips.append(tooltip)
 
+    def _tooltip_text(self, key: str) -> str:
+        return self._active_tooltips.get(key, "")
+
     def _build_menu(self) -> None:
         menubar = tk.Menu(self)
 
@@ -620,25 +865,24 @@ class CableCalcApp(tk.Tk):
         notebook.add(help_tab, text="")
         self._register_notebook_tab(help_tab, "tab.help")
         self._tabs["tab.help"] = help_tab
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         container = ttk.Frame(main_tab)
         container.pack(fill=tk.BOTH, expand=True)
 
         form_frame = ttk.LabelFrame(container)
         form_frame.pack(fill=tk.X, expand=False, side=tk.TOP, pady=(0, 10))
-        self._bind_text(lambda value, widget=form_frame: widget.configure(text=value), "frame.input")
+        self._bind_widget_text(form_frame, "frame.input")
         self._build_form(form_frame)
 
         intermediate_frame = ttk.LabelFrame(container)
         intermediate_frame.pack(fill=tk.X, expand=False, side=tk.TOP, pady=(0, 10))
-        self._bind_text(
-            lambda value, widget=intermediate_frame: widget.configure(text=value), "frame.intermediate"
-        )
+        self._bind_widget_text(intermediate_frame, "frame.intermediate")
         self._build_intermediate_panel(intermediate_frame)
 
         table_frame = ttk.LabelFrame(container)
         table_frame.pack(fill=tk.BOTH, expand=True, side=tk.TOP)
-        self._bind_text(lambda value, widget=table_frame: widget.configure(text=value), "frame.table")
+        self._bind_widget_text(table_frame, "frame.table")
         self._build_table(table_frame)
 
         self._register_form_traces()
@@ -668,10 +912,37 @@ class CableCalcApp(tk.Tk):
         text.grid(row=0, column=0, sticky=tk.NSEW)
         scrollbar.configure(command=text.yview)
         self._help_text_widget = text
-        self._update_help_text()
+
+    def _help_tab_visible(self) -> bool:
+        if self._notebook is None or self._help_text_widget is None:
+            return False
+        return self._notebook.index("current") == self._notebook.index(self._tabs["tab.help"])
+
+    def _on_tab_changed(self, _: tk.Event | None) -> None:
+        if self._help_dirty and self._help_tab_visible():
+            self._update_help_text()
 
     def _build_form(self, parent: ttk.Frame) -> None:
         default_medium_display = self.TEMPERATURE_MEDIA[self._medium_selected_key][self.DEFAULT_LANGUAGE]
+        drop_keys = tuple(self.DROP_LIMIT_KEYS)
+        medium_values = tuple(
+            meta.get(self._active_lang, meta.get(self.DEFAULT_LANGUAGE, ""))
+            for meta in self.TEMPERATURE_MEDIA.values()
+        )
+        # label -> choice values; every combobox keeps its current list in _combobox_values
+        combobox_specs: dict[str, tuple[str, ...]] = {
+            "Tip-IZOLACIJE": self.INSULATION_OPTIONS,
+            "Tip-PROVODNIKA": self.CONDUCTOR_TYPES,
+            "U": self.VOLTAGE_LEVELS,
+            "Način polaganja": self.INSTALLATION_METHODS,
+            "Нагруженные жилы (nž)": self.LOADED_CORE_CHOICES,
+            "Кабелей в группе (для S)": self.GROUP_COUNT_CHOICES,
+            "Параллельные кабели (n∥)": self.PARALLEL_CHOICES,
+            "Среда для Т": medium_values,
+            "Ключ ΔU": drop_keys,
+            "Presek, mm²": self.STANDARD_CROSS_SECTIONS,
+            "In, A": self.STANDARD_BREAKER_RATINGS,
+        }
         field_specs = [
             ("Strujni krug", ""),
             ("Deonica OD", ""),
@@ -694,7 +965,7 @@ class CableCalcApp(tk.Tk):
             ("Температура, °C", "30"),
             ("In, A", ""),
             ("k", "1.45"),
-            ("Ключ ΔU", list(self.DROP_LIMIT_KEYS.keys())[0]),
+            ("Ключ ΔU", drop_keys[0]),
         ]
 
         grid = ttk.Frame(parent)
@@ -709,84 +980,40 @@ class CableCalcApp(tk.Tk):
             grid.columnconfigure(col, weight=weight)
 
         for index, (label, default) in enumerate(field_specs):
-            column = index // rows_per_column
-            row = index % rows_per_column
+            column, row = divmod(index, rows_per_column)
             label_col = column * 2
             entry_col = label_col + 1
 
             label_widget = ttk.Label(grid, text="", anchor="e", justify="right")
             label_widget.grid(row=row, column=label_col, sticky=tk.E, pady=4, padx=(0, 8))
             label_key = self.LABEL_KEY_MAP.get(label, label)
-            self._bind_text(lambda value, widget=label_widget: widget.configure(text=value), label_key)
+            self._bind_widget_text(label_widget, label_key)
 
             var = tk.StringVar(value=default)
             self._form_values[label] = var
 
-            if label == "Tip-IZOLACIJE":
-                widget = ttk.Combobox(grid, textvariable=var, values=self.INSULATION_OPTIONS, state="readonly")
-            elif label == "Tip-PROVODNIKA":
-                widget = ttk.Combobox(grid, textvariable=var, values=self.CONDUCTOR_TYPES, state="readonly")
-            elif label == "U":
-                widget = ttk.Combobox(grid, textvariable=var, values=self.VOLTAGE_LEVELS, state="readonly")
-                self._combobox_values[label] = list(self.VOLTAGE_LEVELS)
-            elif label == "Način polaganja":
-                widget = ttk.Combobox(grid, textvariable=var, values=self.INSTALLATION_METHODS, state="readonly")
-                self._combobox_values[label] = list(self.INSTALLATION_METHODS)
-            elif label == "Нагруженные жилы (nž)":
-                widget = ttk.Combobox(grid, textvariable=var, values=["2", "3"], state="readonly")
-                self._combobox_values[label] = ["2", "3"]
-            elif label == "Кабелей в группе (для S)":
-                widget = ttk.Combobox(
-                    grid, textvariable=var, values=[str(i) for i in range(1, 21)], state="readonly"
-                )
-                self._combobox_values[label] = [str(i) for i in range(1, 21)]
-            elif label == "Параллельные кабели (n∥)":
-                widget = ttk.Combobox(
-                    grid, textvariable=var, values=[str(i) for i in range(1, 7)], state="readonly"
-                )
-                self._combobox_values[label] = [str(i) for i in range(1, 7)]
-            elif label == "Среда для Т":
-                medium_values = [
-                    meta.get(self._language.get(), meta.get(self.DEFAULT_LANGUAGE, ""))
-                    for meta in self.TEMPERATURE_MEDIA.values()
-                ]
-                widget = ttk.Combobox(grid, textvariable=var, values=medium_values, state="readonly")
+            values = combobox_specs.get(label)
+            if values is not None:
+                widget = ttk.Combobox(grid, textvariable=var, values=values, state="readonly")
+                self._combobox_values[label] = values
+            else:
+                widget = ttk.Entry(grid, textvariable=var)
+
+            if label == "Среда для Т":
                 widget.bind("<<ComboboxSelected>>", self._on_medium_changed)
                 self._medium_combobox = widget
-                self._combobox_values[label] = medium_values
-            elif label == "Ключ ΔU":
-                widget = ttk.Combobox(
-                    grid, textvariable=var, values=list(self.DROP_LIMIT_KEYS.keys()), state="readonly"
-                )
-                self._combobox_values[label] = list(self.DROP_LIMIT_KEYS.keys())
             elif label == "Температура, °C":
-                widget = ttk.Entry(grid, textvariable=var)
                 widget.bind("<FocusIn>", self._on_temperature_focus_in)
                 widget.bind("<FocusOut>", self._on_temperature_focus_out)
-            elif label == "Presek, mm²":
-                widget = ttk.Combobox(
-                    grid,
-                    textvariable=var,
-                    values=self.STANDARD_CROSS_SECTIONS,
-                    state="readonly",
-                )
-                self._combobox_values[label] = list(self.STANDARD_CROSS_SECTIONS)
-            elif label == "In, A":
-                widget = ttk.Combobox(
-                    grid,
-                    textvariable=var,
-                    values=self.STANDARD_BREAKER_RATINGS,
-                    state="readonly",
-                )
-                self._combobox_values[label] = list(self.STANDARD_BREAKER_RATINGS)
-            else:
-                widget = ttk.Entry(grid, textvariable=var)
 
             widget.grid(row=row, column=entry_col, sticky=tk.EW, pady=4)
             widget_class = widget.winfo_class()
             original_style = widget.cget("style") or widget_class
             self._input_widgets[label] = widget
             self._input_styles[label] = original_style
+            if widget_class in ("TEntry", "TCombobox"):
+                self._input_alert_styles[label] = f"Invalid.{widget_class}"
+            self._applied_styles[widget] = original_style
             self._attach_tooltip(widget, label_key)
 
         last_field_row_in_last_col = (len(field_specs) - 1) % rows_per_column
@@ -794,19 +1021,33 @@ class CableCalcApp(tk.Tk):
 
         select_button.grid(row=last_field_row_in_last_col + 2, column=7, columnspan=1, padx=10, pady=0)
 
-        self._bind_text(
-            lambda value, widget=select_button: widget.configure(text=value), "button.select_optimal"
-        )
-
-        pi_var = self._form_values["Pi, W"]
-        kj_var = self._form_values["Kj"]
-        pi_var.trace_add("write", self._update_pj_display)
-        kj_var.trace_add("write", self._update_pj_display)
+        self._bind_widget_text(select_button, "button.select_optimal")
 
         for key, default in (("Pj", ""), ("S", "1.0"), ("T", "1.0")):
             if key not in self._form_values:
                 self._form_values[key] = tk.StringVar(value=default)
 
+        # (form field, table column index, variable, is combobox) in the order load_selected_row fills them.
+        self._load_field_plan = tuple(
+            (
+                field,
+                self.TREE_COLUMN_INDEX[column],
+                self._form_values[field],
+                isinstance(self._input_widgets.get(field), ttk.Combobox),
+            )
+            for field, column in self.ROW_FIELD_MAP.items()
+            if field in self._form_values
+        )
+
+        # Variables touched on every recalculation, kept as attributes to skip the dict lookup.
+        self._pi_var = self._form_values["Pi, W"]
+        self._kj_var = self._form_values["Kj"]
+        self._pj_var = self._form_values["Pj"]
+        self._s_var = self._form_values["S"]
+        self._t_var = self._form_values["T"]
+        self._pi_var.trace_add("write", self._update_pj_display)
+        self._kj_var.trace_add("write", self._update_pj_display)
+
     def _build_intermediate_panel(self, parent: ttk.Frame) -> None:
         grid = ttk.Frame(parent)
         grid.pack(fill=tk.X, expand=False, padx=10, pady=10)
@@ -843,12 +1084,14 @@ class CableCalcApp(tk.Tk):
             label_widget = ttk.Label(grid, text="", style="ResultKey.TLabel")
             label_widget.grid(row=row, column=label_col, sticky=tk.W, pady=4, padx=(0, 8))
             label_key = self.RESULT_LABEL_KEY_MAP.get(label_text, label_text)
-            self._bind_text(lambda value, widget=label_widget: widget.configure(text=value), label_key)
+            self._bind_widget_text(label_widget, label_key)
 
             var = tk.StringVar(value="—")
             value_label = ttk.Label(grid, textvariable=var, style="ResultValue.TLabel")
+            self._applied_styles[value_label] = "ResultValue.TLabel"
             value_label.grid(row=row, column=value_col, sticky=tk.EW, pady=4)
             self._intermediate_vars[key] = var
+            self._intermediate_shown[key] = "—"
             self._intermediate_labels[key] = value_label
 
         button_frame = ttk.Frame(parent)
@@ -856,23 +1099,23 @@ class CableCalcApp(tk.Tk):
 
         add_button = ttk.Button(button_frame, text="", command=self.add_row)
         add_button.pack(side=tk.LEFT, padx=(0, 5))
-        self._bind_text(lambda value, widget=add_button: widget.configure(text=value), "button.add_row")
+        self._bind_widget_text(add_button, "button.add_row")
 
         load_button = ttk.Button(button_frame, text="", command=self.load_selected_row)
         load_button.pack(side=tk.LEFT, padx=(0, 5))
-        self._bind_text(lambda value, widget=load_button: widget.configure(text=value), "button.load_row")
+        self._bind_widget_text(load_button, "button.load_row")
 
         delete_button = ttk.Button(button_frame, text="", command=self.remove_selected_row)
         delete_button.pack(side=tk.LEFT, padx=(0, 5))
-        self._bind_text(lambda value, widget=delete_button: widget.configure(text=value), "button.remove_row")
+        self._bind_widget_text(delete_button, "button.remove_row")
 
         clear_button = ttk.Button(button_frame, text="", command=self.clear_table)
         clear_button.pack(side=tk.LEFT, padx=(0, 5))
-        self._bind_text(lambda value, widget=clear_button: widget.configure(text=value), "button.clear")
+        self._bind_widget_text(clear_button, "button.clear")
 
         export_button = ttk.Button(button_frame, text="", command=self.export_to_excel)
         export_button.pack(side=tk.RIGHT)
-        self._bind_text(lambda value, widget=export_button: widget.configure(text=value), "menu.export_excel")
+        self._bind_widget_text(export_button, "menu.export_excel")
 
     def _build_table(self, parent: ttk.Frame) -> None:
         columns = self.TREE_COLUMNS
@@ -885,10 +1128,12 @@ class CableCalcApp(tk.Tk):
         tree = ttk.Treeview(tree_container, columns=columns, show="headings")
         self.tree = tree
 
+        headings: list[tuple[str, str]] = []
         for col in columns:
             key = self.TREE_COLUMN_KEYS.get(col, col)
-            self._register_tree_heading(col, key)
+            headings.append((col, self._register_tree_heading(col, key)))
             tree.column(col, width=120, anchor=tk.CENTER)
+        self._set_tree_headings(headings)
 
         tree.grid(row=0, column=0, sticky=tk.NSEW)
 
@@ -902,13 +1147,53 @@ class CableCalcApp(tk.Tk):
         tree.bind("<Double-1>", lambda e: self.load_selected_row())
 
     def _register_form_traces(self) -> None:
+        input_vars = []
         for name, var in self._form_values.items():
-            if name in {"Pj", "S", "T"}:
+            if name in self.DERIVED_FORM_FIELDS:
                 continue
-            var.trace_add("write", self._update_intermediate_results)
+            var.trace_add("write", self._schedule_intermediate_update)
+            input_vars.append(var)
+        self._input_vars = tuple(input_vars)
         self._update_intermediate_results()
 
+    @contextlib.contextmanager
+    def _suspend_traces(self) -> typing.Iterator[None]:
+        """Ignore form traces while several fields are written; the caller recalculates afterwards."""
+        self._traces_suspended = True
+        try:
+            yield
+        finally:
+            self._traces_suspended = False
+
+    def _schedule_intermediate_update(self, *_: object) -> None:
+        """Coalesce trace-driven recalculations into one run when Tk goes idle."""
+        if self._traces_suspended or self._update_pending:
+            return
+        self._update_pending = True
+        self.after_idle(self._run_pending_update)
+
+    def _run_pending_update(self) -> None:
+        if self._update_pending:
+            # Cleared before the update so a run skipped while loading or suspended cannot block later traces.
+            self._update_pending = False
+            self._update_intermediate_results()
+
+    @staticmethod
+    def _to_float(value: typing.Any) -> float:
+        """Numeric table cell: empty gives 0.0, a decimal comma is accepted, bad text raises ValueError."""
+        if isinstance(value, (int, float)):
+            return float(value)
+        if not value:
+            return 0.0
+        text = value if isinstance(value, str) else str(value)
+        return float(text.replace(",", ".")) if "," in text else float(text)
+
     def _try_parse_float(self, value: str) -> float | None:
+        # float() already ignores surrounding whitespace; only a decimal comma needs the slow path.
+        try:
+            return float(value)
+        except ValueError:
+            pass
         value = value.strip().replace(",", ".")
         if not value:
             return None
@@ -939,10 +1224,11 @@ class CableCalcApp(tk.Tk):
                 return "—"
         except TypeError:
             return "—"
-        formatted = f"{value:.{digits}f}"
-        if self._language.get() in {"ru", "sr"}:
-            formatted = formatted.replace(".", ",")
-        return formatted
+        decimal_comma = self._active_lang in self.DECIMAL_COMMA_LANGUAGES
+        if not value:
+            # 0.0 and -0.0 share a cache key but print differently, so zero bypasses the cache.
+            return _format_fixed.__wrapped__(value, digits, decimal_comma)
+        return _format_fixed(value, digits, decimal_comma)
 
     def _lookup_ampacity(
         self, insulation_key: str, conductor: str, laying: str, area: float, loaded_cores: int
@@ -961,70 +1247,86 @@ class CableCalcApp(tk.Tk):
         if multiplier is None or load_multiplier is None:
             return None
 
-        standard_sections = sorted(base_table)
-        if not standard_sections:
-            return None
+        standard_sections = self._ampacity_sections.get(laying)
+        if standard_sections is None:
+            standard_sections = self._ampacity_sections[laying] = tuple(sorted(base_table))
 
         if area <= standard_sections[0]:
             base_value = base_table[standard_sections[0]]
         elif area >= standard_sections[-1]:
             base_value = base_table[standard_sections[-1]]
         else:
-            for lower, upper in zip(standard_sections, standard_sections[1:]):
+            # Only the bracket holding area, and the one before it when area sits on a boundary, can match.
+            start = max(bisect.bisect_right(standard_sections, area) - 2, 0)
+            for lower, upper in zip(standard_sections[start:], standard_sections[start + 1 :]):
                 if math.isclose(area, lower, rel_tol=1e-6, abs_tol=1e-3):
                     base_value = base_table[lower]
                     break
                 if lower <= area <= upper:
-                    lower_val = base_table[lower]
-                    upper_val = base_table[upper]
-                    if math.isclose(upper, lower):
-                        base_value = lower_val
-                    else:
-                        ratio = (area - lower) / (upper - lower)
-                        base_value = lower_val + ratio * (upper_val - lower_val)
+                    base_value = _interpolate(area, lower, upper, base_table[lower], base_table[upper])
                     break
             else:
                 return None
 
         return base_value * multiplier * load_multiplier
 
+    def _ampacity_row(
+        self, insulation_key: str, conductor: str, laying: str, loaded_cores: int
+    ) -> tuple[float | None, ...]:
+        key = (insulation_key, conductor, laying, loaded_cores)
+        row = self._ampacity_rows.get(key)
+        if row is None:
+            row = self._ampacity_rows[key] = tuple(
+                self._lookup_ampacity(insulation_key, conductor, laying, area, loaded_cores) if area > 0 else None
+                for area in self.STANDARD_SECTIONS
+            )
+        return row
+
     def _lookup_group_factor(self, circuits: int) -> float:
         if circuits <= 1:
             return 1.0
-        max_defined = max(self.GROUPING_FACTORS)
+        if self._grouping_max is None:
+            max_defined = max(self.GROUPING_FACTORS)
+            self._grouping_max = (max_defined, self.GROUPING_FACTORS[max_defined])
+        max_defined, max_factor = self._grouping_max
         if circuits >= max_defined:
-            return self.GROUPING_FACTORS[max_defined]
-        return self.GROUPING_FACTORS.get(circuits, self.GROUPING_FACTORS[max_defined])
+            return max_factor
+        return self.GROUPING_FACTORS.get(circuits, max_factor)
 
     def _lookup_temperature_factor(self, insulation_key: str, medium: str, temperature: float) -> float | None:
-        if medium == "soil":
-            table = self.KT_Z_TABLE.get(insulation_key)
-        else:
-            table = self.KT_V_TABLE.get(insulation_key)
+        table_name = "KT_Z_TABLE" if medium == "soil" else "KT_V_TABLE"
+        table = getattr(self, table_name).get(insulation_key)
         if not table:
             return None
 
-        points = sorted(table)
-        if not points:
-            return None
-        if temperature < points[0] or temperature > points[-1]:
+        cache_key = (table_name, insulation_key)
+        points = self._temperature_points.get(cache_key)
+        if points is None:
+            points = self._temperature_points[cache_key] = tuple(sorted(table))
+        if not points[0] <= temperature <= points[-1]:
             return None
 
         if temperature in table:
             return table[temperature]
 
-        for lower, upper in zip(points, points[1:]):
-            if lower <= temperature <= upper:
-                lower_val = table[lower]
-                upper_val = table[upper]
-                if math.isclose(upper, lower):
-                    return lower_val
-                ratio = (temperature - lower) / (upper - lower)
-                return lower_val + ratio * (upper_val - lower_val)
-        return None
+        index = bisect.bisect_right(points, temperature)
+        lower, upper = points[index - 1], points[index]
+        return _interpolate(temperature, lower, upper, table[lower], table[upper])
 
     def _calculate_line_impedance(
         self, conductor: str, insulation_temp: float, area: float, laying: str
+    ) -> tuple[float, float]:
+        cache_key = (conductor, insulation_temp, area, laying)
+        cached = self._impedance_cache.get(cache_key)
+        if cached is None:
+            if len(self._impedance_cache) >= self.IMPEDANCE_CACHE_SIZE:
+                self._impedance_cache.clear()
+            cached = self._compute_line_impedance(conductor, insulation_temp, area, laying)
+            self._impedance_cache[cache_key] = cached
+        return cached
+
+    def _compute_line_impedance(
+        self, conductor: str, insulation_temp: float, area: float, laying: str
     ) -> tuple[float, float]:
         rho_20 = self.RESISTIVITY_20.get(conductor)
         alpha = self.TEMP_COEFF.get(conductor)
@@ -1045,6 +1347,13 @@ class CableCalcApp(tk.Tk):
             bucket = ">240"
         elif area > 95:
             bucket = "≤240"
+        lut_key = (laying, bucket)
+        x_per_km = self._reactance_lut.get(lut_key)
+        if x_per_km is None:
+            x_per_km = self._reactance_lut[lut_key] = self._resolve_reactance(laying, bucket)
+        return r_per_km, x_per_km
+
+    def _resolve_reactance(self, laying: str, bucket: str) -> float:
         # Prefer externally loaded reactance data if available
         x_per_km = None
         if isinstance(getattr(self, "REACTANCE_DATA", None), dict) and self.REACTANCE_DATA:
@@ -1064,7 +1373,7 @@ class CableCalcApp(tk.Tk):
                 x_per_km = self.REACTANCE_DATA.get("default", 0.08)
             else:
                 x_per_km = 0.08
-        return r_per_km, x_per_km
+        return x_per_km
 
     def _drop_pct(
         self,
@@ -1080,13 +1389,10 @@ class CableCalcApp(tk.Tk):
         icalc_total: float,
     ) -> float:
         r_km, x_km = self._calculate_line_impedance(conductor, insulation_theta, area_mm2, method)
-        divider = max(n_parallel, 1)
-        r_m, x_m = (r_km / 1000.0) / divider, (x_km / 1000.0) / divider
-        sin_phi = math.sqrt(max(0.0, 1.0 - min(1.0, cos_phi) ** 2))
-        phase = 2.0 if loaded_cores == 2 else math.sqrt(3)
+        phase = 2.0 if loaded_cores == 2 else self.SQRT3
         if U == 0:
             return 0.0
-        return phase * icalc_total * (r_m * cos_phi + x_m * sin_phi) * L_m * 100.0 / U
+        return _voltage_drop_pct(phase, icalc_total, r_km, x_km, n_parallel, cos_phi, _sin_phi(cos_phi), L_m, U)
 
     def _recommend(
         self,
@@ -1126,125 +1432,60 @@ class CableCalcApp(tk.Tk):
                 f"Iz_tot≈{fmt(iz_total, digits=0)} A, ΔU≈{fmt(drop_val)}%"
             )
 
-        # 1) Increase section within same method/insulation
-        best_section_line = None
-        for area_candidate in self.STANDARD_SECTIONS:
-            if area_candidate < min_section:
-                continue
-            iz_base = self._lookup_ampacity(insulation_key, conductor, method, area_candidate, loaded_cores)
-            if not iz_base:
-                continue
-            iz_one = iz_base * S * T
-            if iz_one < current_per_cable:
-                continue
-            drop_val = self._drop_pct(
-                U,
-                cos_phi,
-                L,
-                conductor,
-                insulation_theta,
-                area_candidate,
-                method,
-                loaded_cores,
-                parallel_count,
-                icalc_total,
-            )
-            if limit_pct is not None and drop_val > limit_pct:
-                continue
-            best_section_line = candidate_description("Увеличить сечение до", area_candidate, method, iz_one, drop_val)
-            break
-        if best_section_line:
-            recs.append(best_section_line)
-
-        # 2) Change method according to preference
-        best_method_line = None
-        for m in self.METHOD_PREFERENCE:
-            if m == method:
-                continue
-            for area_candidate in self.STANDARD_SECTIONS:
-                if area_candidate < min_section:
-                    continue
-                iz_base = self._lookup_ampacity(insulation_key, conductor, m, area_candidate, loaded_cores)
+        candidate_sections = self.STANDARD_SECTIONS[bisect.bisect_left(self.STANDARD_SECTIONS, min_section) :]
+        # Power factor and phase terms are the same for every candidate below.
+        phase = 2.0 if loaded_cores == 2 else self.SQRT3
+        sin_phi = _sin_phi(cos_phi)
+
+        def drop_pct(theta_val: float, area_val: float, method_val: str, parallel: int) -> float:
+            r_km, x_km = self._calculate_line_impedance(conductor, theta_val, area_val, method_val)
+            if U == 0:
+                return 0.0
+            return _voltage_drop_pct(phase, icalc_total, r_km, x_km, parallel, cos_phi, sin_phi, L, U)
+
+        def first_fitting_section(
+            insulation_val: str, theta_val: float, method_val: str
+        ) -> tuple[float, float, float] | None:
+            """Smallest candidate section that carries the current and keeps ΔU within the limit."""
+            for area_candidate in candidate_sections:
+                iz_base = self._lookup_ampacity(insulation_val, conductor, method_val, area_candidate, loaded_cores)
                 if not iz_base:
                     continue
                 iz_one = iz_base * S * T
                 if iz_one < current_per_cable:
                     continue
-                drop_val = self._drop_pct(
-                    U,
-                    cos_phi,
-                    L,
-                    conductor,
-                    insulation_theta,
-                    area_candidate,
-                    m,
-                    loaded_cores,
-                    parallel_count,
-                    icalc_total,
-                )
+                drop_val = drop_pct(theta_val, area_candidate, method_val, parallel_count)
                 if limit_pct is not None and drop_val > limit_pct:
                     continue
-                best_method_line = candidate_description("Сменить метод на", area_candidate, m, iz_one, drop_val)
-                break
-            if best_method_line:
+                return area_candidate, iz_one, drop_val
+            return None
+
+        # 1) Increase section within same method/insulation
+        fit = first_fitting_section(insulation_key, insulation_theta, method)
+        if fit:
+            recs.append(candidate_description("Увеличить сечение до", fit[0], method, fit[1], fit[2]))
+
+        # 2) Change method according to preference
+        for m in self.METHOD_PREFERENCE:
+            if m == method:
+                continue
+            fit = first_fitting_section(insulation_key, insulation_theta, m)
+            if fit:
+                recs.append(candidate_description("Сменить метод на", fit[0], m, fit[1], fit[2]))
                 break
-        if best_method_line:
-            recs.append(best_method_line)
 
         # 3) Switch to XLPE if currently PVC
         if insulation_key == "PVC":
             xlpe_meta = self.INSULATION_META.get("XLPE/EPR (90°C)")
             xlpe_theta = xlpe_meta.get("theta", 90.0) if xlpe_meta else 90.0
-            best_xlpe_line = None
-            for area_candidate in self.STANDARD_SECTIONS:
-                if area_candidate < min_section:
-                    continue
-                iz_base = self._lookup_ampacity("XLPE", conductor, method, area_candidate, loaded_cores)
-                if not iz_base:
-                    continue
-                iz_one = iz_base * S * T
-                if iz_one < current_per_cable:
-                    continue
-                drop_val = self._drop_pct(
-                    U,
-                    cos_phi,
-                    L,
-                    conductor,
-                    xlpe_theta,
-                    area_candidate,
-                    method,
-                    loaded_cores,
-                    parallel_count,
-                    icalc_total,
-                )
-                if limit_pct is not None and drop_val > limit_pct:
-                    continue
-                digits = 0 if float(area_candidate).is_integer() else 1
-                area_str = fmt(area_candidate, digits=digits)
-                iz_total = iz_one * parallel_count
-                best_xlpe_line = (
-                    f"Перейти на XLPE и {area_str} мм² (метод {method}) → "
-                    f"Iz_tot≈{fmt(iz_total, digits=0)} A, ΔU≈{fmt(drop_val)}%"
-                )
-                break
-            if best_xlpe_line:
-                recs.append(best_xlpe_line)
+            fit = first_fitting_section("XLPE", xlpe_theta, method)
+            if fit:
+                recs.append(candidate_description("Перейти на XLPE и", fit[0], method, fit[1], fit[2]))
 
         # 4) Increase number of parallel cables to meet voltage drop
         if limit_pct is not None:
             base_area = max(min_section, current_area or self.STANDARD_SECTIONS[0])
-            drop_current = self._drop_pct(
-                U,
-                cos_phi,
-                L,
-                conductor,
-                insulation_theta,
-                base_area,
-                method,
-                loaded_cores,
-                parallel_count,
-                icalc_total,
-            )
+            drop_current = drop_pct(insulation_theta, base_area, method, parallel_count)
             if drop_current > limit_pct:
                 iz_base = self._lookup_ampacity(insulation_key, conductor, method, base_area, loaded_cores)
                 if iz_base:
@@ -1253,18 +1494,7 @@ class CableCalcApp(tk.Tk):
                     n_needed = max(parallel_count + 1, math.ceil(drop_current * parallel_count / denom))
                     if iz_one > 0:
                         max_total = iz_one * n_needed
-                        drop_new = self._drop_pct(
-                            U,
-                            cos_phi,
-                            L,
-                            conductor,
-                            insulation_theta,
-                            base_area,
-                            method,
-                            loaded_cores,
-                            n_needed,
-                            icalc_total,
-                        )
+                        drop_new = drop_pct(insulation_theta, base_area, method, n_needed)
                         digits = 0 if float(base_area).is_integer() else 1
                         area_str = fmt(base_area, digits=digits)
                         recs.append(
@@ -1277,20 +1507,25 @@ class CableCalcApp(tk.Tk):
         return recs[:4]
 
     def _update_pj_display(self, *_: object) -> None:
-        pi = self._try_parse_float(self._form_values["Pi, W"].get())
-        kj = self._try_parse_float(self._form_values["Kj"].get())
+        pi = self._try_parse_float(self._pi_var.get())
+        kj = self._try_parse_float(self._kj_var.get())
         if pi is None or kj is None:
-            self._form_values["Pj"].set("")
-            self._update_intermediate_results()
-            return
-        self._form_values["Pj"].set(self._fmt(pi * kj))
-        self._update_intermediate_results()
+            self._pj_var.set("")
+        else:
+            self._pj_var.set(self._fmt(pi * kj))
+        self._schedule_intermediate_update()
 
     def _set_result_alert(self, key: str, alert: bool) -> None:
         label = self._intermediate_labels.get(key)
         if not label:
             return
-        label.configure(style="ResultAlert.TLabel" if alert else "ResultValue.TLabel")
+        self._apply_style(label, "ResultAlert.TLabel" if alert else "ResultValue.TLabel")
+
+    def _apply_style(self, widget: tk.Widget, style: str) -> None:
+        if self._applied_styles.get(widget) == style:
+            return
+        widget.configure(style=style)
+        self._applied_styles[widget] = style
 
     def _validate_counts(
         self,
@@ -1320,22 +1555,19 @@ class CableCalcApp(tk.Tk):
         widget = self._input_widgets.get(field_name)
         if widget is None:
             return
-        default_style = self._input_styles.get(field_name, "")
         if not alert:
-            widget.configure(style=default_style)
+            self._apply_style(widget, self._input_styles.get(field_name, ""))
             return
-        widget_class = widget.winfo_class()
-        if widget_class == "TEntry":
-            widget.configure(style="Invalid.TEntry")
-        elif widget_class == "TCombobox":
-            widget.configure(style="Invalid.TCombobox")
+        alert_style = self._input_alert_styles.get(field_name)
+        if alert_style is not None:
+            self._apply_style(widget, alert_style)
 
     def _on_temperature_focus_in(self, _: tk.Event) -> None:
         self._temperature_editing = True
 
     def _on_temperature_focus_out(self, _: tk.Event) -> None:
         self._temperature_editing = False
-        self._update_intermediate_results()
+        self._schedule_intermediate_update()
 
     def _show_temperature_warning(self, insulation_key: str, medium: str, temperature: float) -> None:
         if self._temperature_editing:
@@ -1361,14 +1593,24 @@ class CableCalcApp(tk.Tk):
     def _update_intermediate_results(self, *_: object) -> None:
         if not self._intermediate_vars:
             return
-        if self._loading_project or self._loading_row_into_form:
+        if self._loading_project or self._traces_suspended:
+            return
+        self._update_pending = False
+
+        # Everything the panel depends on besides the data tables, which reset the signature on reload.
+        input_sig = (
+            self._table_revision,
+            self._active_lang,
+            self._medium_selected_key,
+            self._temperature_editing,
+            *(var.get() for var in self._input_vars),
+        )
+        if input_sig == self._last_input_sig:
             return
 
         self._last_icalc = None
-        for key, var in self._intermediate_vars.items():
-            if key == "Limit ΔU %":
-                continue
-            var.set("—")
+        # Panel values are staged here and written once at the end, see _publish_intermediate_results.
+        results = dict.fromkeys(self._intermediate_vars, "—")
 
         for key in ("ΔU %", "По ΔU", "По току", "Защита", "Ukupni ΔU %"):
             self._set_result_alert(key, False)
@@ -1388,9 +1630,9 @@ class CableCalcApp(tk.Tk):
         drop_key = self._form_values["Ключ ΔU"].get()
         limit_delta = self.DROP_LIMIT_KEYS.get(drop_key)
         if limit_delta is not None:
-            self._intermediate_vars["Limit ΔU %"].set(self._fmt(limit_delta))
+            results["Limit ΔU %"] = self._fmt(limit_delta)
         else:
-            self._intermediate_vars["Limit ΔU %"].set("—")
+            results["Limit ΔU %"] = "—"
 
         loaded_cores = 3
         cores_alert = False
@@ -1423,19 +1665,21 @@ class CableCalcApp(tk.Tk):
             parallel_alert = True
         self._set_entry_alert("Параллельные кабели (n∥)", parallel_alert)
 
-        pi = self._try_parse_float(self._form_values["Pi, W"].get())
-        kj = self._try_parse_float(self._form_values["Kj"].get())
+        pi = self._try_parse_float(self._pi_var.get())
+        kj = self._try_parse_float(self._kj_var.get())
         eta_value = self._try_parse_float(self._form_values["η"].get())
         cos_phi = self._try_parse_float(self._form_values["cos φ"].get())
         length = self._try_parse_float(self._form_values["Dužina L, m"].get())
-        area = self._try_parse_float(self._form_values["Presek, mm²"].get())
+        area_input = self._try_parse_float(self._form_values["Presek, mm²"].get())
+        area = area_input
         temperature = self._try_parse_float(self._form_values["Температура, °C"].get())
 
         effective_circuits = max(1, circuits_count + n_parallel - 1) if n_parallel > 1 else circuits_count
         group_factor = self._lookup_group_factor(effective_circuits)
         s_display = self._fmt(group_factor)
-        self._form_values["S"].set(s_display if s_display != "—" else "")
-        self._intermediate_vars["S"].set(s_display)
+        s_text = s_display if s_display != "—" else ""
+        self._s_var.set(s_text)
+        results["S"] = s_display
         s_coeff = group_factor
 
         temperature_alert = False
@@ -1461,11 +1705,11 @@ class CableCalcApp(tk.Tk):
             ):
                 self._show_temperature_warning(insulation_meta["key"], medium_key, temperature)
         if t_display:
-            self._form_values["T"].set(t_display)
-            self._intermediate_vars["T"].set(t_display)
+            self._t_var.set(t_display)
+            results["T"] = t_display
         else:
-            self._form_values["T"].set("")
-            self._intermediate_vars["T"].set("—")
+            self._t_var.set("")
+            results["T"] = "—"
         if self._temperature_editing:
             temperature_alert = False
         self._set_entry_alert("Температура, °C", temperature_alert)
@@ -1496,7 +1740,7 @@ class CableCalcApp(tk.Tk):
         pj = None
         if pi is not None and kj is not None:
             pj = pi * kj
-            self._intermediate_vars["Pj, W"].set(self._fmt(pj))
+            results["Pj, W"] = self._fmt(pj)
 
         cos_alert = False
         if cos_phi is not None:
@@ -1515,23 +1759,20 @@ class CableCalcApp(tk.Tk):
             length_alert = True
             length = None
 
-        self._set_entry_alert("Presek, mm²", area_alert)
-        self._set_entry_alert("Dužina L, m", length_alert)
-
         in_range_alert = False
         icalc_total = None
         icalc_per_cable = None
-        phase_factor = None
+        divider = max(n_parallel, 1)
+        phase_factor = 2.0 if loaded_cores == 2 else self.SQRT3
         if pj is not None and cos_phi is not None and voltage_value and eta_coeff is not None:
-            phase_factor = 2.0 if loaded_cores == 2 else math.sqrt(3)
             denominator = phase_factor * voltage_value * cos_phi
             if denominator:
                 icalc_total = (pj / eta_coeff) / denominator
-                self._intermediate_vars["Icalc [A]"].set(self._fmt(icalc_total, digits=3))
+                results["Icalc [A]"] = self._fmt(icalc_total, digits=3)
                 self._last_icalc = icalc_total
-                icalc_per_cable = icalc_total / max(n_parallel, 1)
+                icalc_per_cable = icalc_total / divider
         else:
-            self._intermediate_vars["Icalc [A]"].set("—")
+            results["Icalc [A]"] = "—"
 
         r_per_km = None
         x_per_km = None
@@ -1539,7 +1780,7 @@ class CableCalcApp(tk.Tk):
             r_per_km, x_per_km = self._calculate_line_impedance(
                 conductor, insulation_meta["theta"], area, laying
             )
-            self._intermediate_vars["R_base [Ω/km]"].set(self._fmt(r_per_km, digits=3))
+            results["R_base [Ω/km]"] = self._fmt(r_per_km, digits=3)
 
         base_ampacity = None
         if area is not None and insulation_meta is not None:
@@ -1550,9 +1791,9 @@ class CableCalcApp(tk.Tk):
         iz_one = None
         if base_ampacity is not None and t_coeff is not None:
             iz_one = base_ampacity * s_coeff * t_coeff
-            self._intermediate_vars["Iz [A]"].set(self._fmt(iz_one))
+            results["Iz [A]"] = self._fmt(iz_one)
         elif base_ampacity is None:
-            self._intermediate_vars["Iz [A]"].set("—")
+            results["Iz [A]"] = "—"
 
         in_range_value = "—"
         if icalc_total is not None and iz_one is not None:
@@ -1561,7 +1802,7 @@ class CableCalcApp(tk.Tk):
             if iz_total + 1e-9 < icalc_total:
                 in_range_alert = True
         if "Диапазон In [A]" in self._intermediate_vars:
-            self._intermediate_vars["Диапазон In [A]"].set(in_range_value)
+            results["Диапазон In [A]"] = in_range_value
 
         ampacity_status = None
         if base_ampacity is None:
@@ -1572,39 +1813,43 @@ class CableCalcApp(tk.Tk):
             ampacity_status = "OK" if icalc_per_cable <= iz_one else "NE"
         ampacity_alert = ampacity_status == "NE" or area_alert
         if ampacity_status is not None:
-            self._intermediate_vars["По току"].set(ampacity_status)
+            results["По току"] = ampacity_status
             self._set_result_alert("По току", ampacity_alert)
         self._set_entry_alert("Presek, mm²", ampacity_alert)
 
         delta_u = None
         if (
             icalc_total is not None
-            and phase_factor is not None
             and length is not None
             and cos_phi is not None
             and r_per_km is not None
             and x_per_km is not None
             and voltage_value
         ):
-            divider = max(n_parallel, 1)
-            r_per_meter = (r_per_km / 1000.0) / divider
-            x_per_meter = (x_per_km / 1000.0) / divider
-            sin_phi = math.sqrt(max(0.0, 1.0 - min(1.0, cos_phi) ** 2))
-            impedance_drop = r_per_meter * cos_phi + x_per_meter * sin_phi
-            delta_u = phase_factor * icalc_total * impedance_drop * length * 100.0 / voltage_value
-            self._intermediate_vars["ΔU %"].set(self._fmt(delta_u))
+            delta_u = _voltage_drop_pct(
+                phase_factor,
+                icalc_total,
+                r_per_km,
+                x_per_km,
+                n_parallel,
+                cos_phi,
+                _sin_phi(cos_phi),
+                length,
+                voltage_value,
+            )
+            results["ΔU %"] = self._fmt(delta_u)
         elif "ΔU %" in self._intermediate_vars:
-            self._intermediate_vars["ΔU %"].set("—")
+            results["ΔU %"] = "—"
 
         drop_status = None
         if delta_u is not None and limit_delta is not None:
             drop_status = "OK" if delta_u <= limit_delta else "NE"
-            self._intermediate_vars["По ΔU"].set(drop_status)
+            results["По ΔU"] = drop_status
             self._set_result_alert("По ΔU", drop_status == "NE")
             self._set_result_alert("ΔU %", drop_status == "NE")
         elif delta_u is not None:
             drop_status = "—"
-            self._intermediate_vars["По ΔU"].set(drop_status)
+            results["По ΔU"] = drop_status
 
         drop_alert = (drop_status == "NE") or length_alert
         self._set_entry_alert("Dužina L, m", drop_alert)
@@ -1613,14 +1858,14 @@ class CableCalcApp(tk.Tk):
         existing_drop = self._sum_drop_chain_ending_at(strujni_krug, form_od)
         if delta_u is not None:
             total_drop = existing_drop + delta_u
-            self._intermediate_vars["Ukupni ΔU %"].set(self._fmt(total_drop))
+            results["Ukupni ΔU %"] = self._fmt(total_drop)
             if limit_delta is not None:
                 total_status = "OK" if total_drop <= limit_delta else "NE"
                 self._set_result_alert("Ukupni ΔU %", total_status == "NE")
             else:
                 self._set_result_alert("Ukupni ΔU %", False)
         elif existing_drop > 0:
-            self._intermediate_vars["Ukupni ΔU %"].set(self._fmt(existing_drop))
+            results["Ukupni ΔU %"] = self._fmt(existing_drop)
 
         in_value = self._try_parse_float(self._form_values["In, A"].get())
         k_value = self._try_parse_float(self._form_values["k"].get())
@@ -1638,9 +1883,9 @@ class CableCalcApp(tk.Tk):
 
         if in_value is not None and k_value is not None:
             i2_value = in_value * k_value
-            self._intermediate_vars["I2 [A]"].set(self._fmt(i2_value))
+            results["I2 [A]"] = self._fmt(i2_value)
         else:
-            self._intermediate_vars["I2 [A]"].set("—")
+            results["I2 [A]"] = "—"
 
         if iz_one is None or icalc_total is None or in_value is None or i2_value is None:
             if in_value is None or i2_value is None:
@@ -1657,27 +1902,34 @@ class CableCalcApp(tk.Tk):
                 protection_status = "NE"
                 protection_alert = True
 
-        self._intermediate_vars["Защита"].set(protection_status)
+        results["Защита"] = protection_status
         self._set_result_alert("Защита", protection_alert)
         self._set_result_alert("Диапазон In [A]", in_range_alert or protection_alert)
         self._set_entry_alert("In, A", protection_alert)
 
+        codes = self.STATUS_CODES
+        compat_code = (
+            codes.get(ampacity_status, 2)
+            | codes.get(drop_status, 2) << 2
+            | codes.get(protection_status, 2) << 4
+        )
+        if not compat_code:
+            compat_key = "status.ok"
+        elif compat_code & 0b010101:
+            compat_key = "status.fail"
+        else:
+            compat_key = "status.na"
+        # Resolved once; the panel and _last_result below show the same translated status.
+        compat_text = self._(compat_key)
+
         if "Совместимость IEC" in self._intermediate_vars:
             if base_ampacity is None:
                 compat_display = self._("status.na")
                 compat_alert = False
             else:
-                statuses = [ampacity_status, drop_status, protection_status]
-                if all(status == "OK" for status in statuses):
-                    compat_display = self._("status.ok")
-                    compat_alert = False
-                elif any(status == "NE" for status in statuses):
-                    compat_display = self._("status.fail")
-                    compat_alert = True
-                else:
-                    compat_display = self._("status.na")
-                    compat_alert = False
-            self._intermediate_vars["Совместимость IEC"].set(compat_display)
+                compat_display = compat_text
+                compat_alert = compat_key == "status.fail"
+            results["Совместимость IEC"] = compat_display
             self._set_result_alert("Совместимость IEC", compat_alert)
 
         if (
@@ -1686,89 +1938,153 @@ class CableCalcApp(tk.Tk):
             and insulation_meta is not None
             and pj is not None
         ):
-            self._last_result = {
-                "pj": pj,
-                "s_coeff": s_coeff,
-                "t_coeff": t_coeff or 1.0,
-                "icalc_total": icalc_total,
-                "r_per_km": r_per_km,
-                "sigma": (
+            self._last_result = _CalcResult(
+                pj=pj,
+                s_coeff=s_coeff,
+                t_coeff=t_coeff or 1.0,
+                icalc_total=icalc_total,
+                r_per_km=r_per_km,
+                sigma=(
                     1.0 / self.RESISTIVITY_20[conductor]
                     if conductor in self.RESISTIVITY_20 and self.RESISTIVITY_20[conductor] > 0
                     else None
                 ),
-                "iz_one": iz_one,
-                "delta_u": delta_u,
-                "ampacity_ok": ampacity_status,
-                "drop_ok": drop_status,
-                "protection_status": protection_status,
-                "i2_value": i2_value,
-                "in_value": in_value,
-                "k_value": k_value,
-                "compatibility_status": (
-                    self._("status.no_data")
-                    if base_ampacity is None
-                    else self._("status.ok")
-                    if (ampacity_status == "OK" and drop_status == "OK" and protection_status == "OK")
-                    else self._("status.fail")
-                    if (ampacity_status == "NE" or drop_status == "NE" or protection_status == "NE")
-                    else self._("status.na")
-                ),
-            }
+                iz_one=iz_one,
+                delta_u=delta_u,
+                ampacity_ok=ampacity_status,
+                drop_ok=drop_status,
+                protection_status=protection_status,
+                i2_value=i2_value,
+                in_value=in_value,
+                k_value=k_value,
+                compatibility_status=self._("status.no_data") if base_ampacity is None else compat_text,
+            )
         else:
             self._last_result = None
 
         recommendations: list[str] = []
-        rec_var = self._intermediate_vars.get("Рекомендации")
-        if rec_var is not None:
-            ampacity_state = self._intermediate_vars.get("По току")
-            drop_state = self._intermediate_vars.get("По ΔU")
-            ampacity_value = ampacity_state.get() if ampacity_state is not None else ""
-            drop_value = drop_state.get() if drop_state is not None else ""
-            if ampacity_value == "NE" or drop_value == "NE":
-                insulation_label = self._form_values["Tip-IZOLACIJE"].get()
-                insulation_meta = self.INSULATION_META.get(
-                    insulation_label, {"key": "PVC", "theta": 70}
-                )
+        if "Рекомендации" in self._intermediate_vars:
+            if results.get("По току") == "NE" or results.get("По ΔU") == "NE":
+                # Form values were read at the top of this method; S and T are the texts written above.
+                rec_meta = self.INSULATION_META.get(insulation_label, {"key": "PVC", "theta": 70})
                 try:
-                    loaded_cores_value = int(
-                        self._form_values["Нагруженные жилы (nž)"].get() or "3"
-                    )
+                    rec_loaded_cores = int(loaded_cores_value or "3")
                 except (TypeError, ValueError):
-                    loaded_cores_value = 3
-                s_value = self._try_parse_float(self._form_values["S"].get())
-                t_value = self._try_parse_float(self._form_values["T"].get())
-                recs = self._recommend(
+                    rec_loaded_cores = 3
+                s_value = self._try_parse_float(s_text)
+                t_value = self._try_parse_float(t_display)
+                rec_args = dict(
                     U=float(voltage_value or 0),
-                    cos_phi=float(cos_phi or 0),
-                    L=float(length or 0),
-                    conductor=self._form_values["Tip-PROVODNIKA"].get(),
-                    insulation_key=insulation_meta.get("key", "PVC"),
-                    insulation_theta=float(insulation_meta.get("theta", 70)),
-                    method=self._form_values["Način polaganja"].get().strip(),
-                    loaded_cores=loaded_cores_value,
+                    cos_phi=cos_phi or 0.0,
+                    L=length or 0.0,
+                    conductor=conductor,
+                    insulation_key=rec_meta.get("key", "PVC"),
+                    insulation_theta=rec_meta.get("theta", 70),
+                    method=laying,
+                    loaded_cores=rec_loaded_cores,
                     S=s_value if s_value is not None else 1.0,
                     T=t_value if t_value is not None else 1.0,
-                    limit_pct=self.DROP_LIMIT_KEYS.get(self._form_values["Ключ ΔU"].get()),
-                    current_area=self._try_parse_float(self._form_values["Presek, mm²"].get())
-                    or 0,
+                    limit_pct=limit_delta,
+                    current_area=area_input or 0,
                     n_parallel=n_parallel,
                     icalc_total=self._last_icalc or 0,
                 )
-                recommendations = recs or []
-            rec_var.set("\n".join(recommendations) if recommendations else "—")
+                # Edits to fields the search does not read leave the key unchanged and reuse the last result.
+                rec_key = (self._active_lang, *rec_args.values())
+                if rec_key != self._last_rec_key:
+                    self._last_rec_result = self._recommend(**rec_args)
+                    self._last_rec_key = rec_key
+                recommendations = self._last_rec_result or []
+            results["Рекомендации"] = "\n".join(recommendations) if recommendations else "—"
+
+        self._publish_intermediate_results(results)
+        # Recorded only once the panel is fully written, so a failed pass is retried on the next trace.
+        self._last_input_sig = input_sig
+
+    def _publish_intermediate_results(self, values: dict[str, str]) -> None:
+        """Write staged panel values, skipping variables whose text is unchanged."""
+        shown = self._intermediate_shown
+        for key, value in values.items():
+            if shown.get(key) == value:
+                continue
+            var = self._intermediate_vars.get(key)
+            if var is not None:
+                var.set(value)
+                shown[key] = value
+
+    def _export_cell_value(self, raw: typing.Any) -> typing.Any:
+        if isinstance(raw, (int, float)):
+            return raw
+        text = str(raw)
+        stripped = text.strip()
+        if stripped in self.EMPTY_CELL_TEXTS:
+            return text
+        # Most statuses, names and methods ("OK", "E", ...) cannot start a number, so they skip the raising
+        # parse. Texts that start like "inf" or "nan" (e.g. "NE") still go through it.
+        head = stripped[0]
+        if not (head.isdigit() or head in self.FLOAT_START_CHARS):
+            return text
+        number = self._try_parse_float(text)
+        return number if number is not None else text
+
+    def _append_table_row(self, values: typing.Sequence[str]) -> None:
+        # values are the row's cell texts in TREE_COLUMNS order, exactly as shown in the tree.
+        row = tuple(values)
+        index = self.TREE_COLUMN_INDEX
+        self._table_revision += 1
+        self._table_data.append(row)
+        cells = tuple(map(self._export_cell_value, row))
+        self._table_cells.append(cells)
+        self._table_col_widths[:] = map(max, self._table_col_widths, map(_cell_width, cells))
+        try:
+            drop = self._to_float(row[index[self.DELTA_U_KEY]])
+        except (TypeError, ValueError):
+            drop = 0.0
+        derived = (
+            row[index[self.CIRCUIT_KEY]].strip(),
+            row[index["OD"]].strip(),
+            row[index["DO"]].strip(),
+            row[index["L"]].replace(",", ".").strip(),
+            row[index["Presek"]].replace(",", ".").strip(),
+            drop,
+        )
+        for column, value in zip(self._chain_columns.values(), derived):
+            column.append(value)
+        self._idx_by_do.setdefault((derived[0], derived[2]), []).append(len(self._table_data) - 1)
+
+    def _delete_table_row(self, index: int) -> None:
+        # Shifts the indices of later rows; callers rebuild _idx_by_do once after their last delete.
+        self._table_revision += 1
+        del self._table_data[index]
+        del self._table_cells[index]
+        for column in self._chain_columns.values():
+            del column[index]
+        self._table_col_widths_stale = True
+
+    def _clear_table_rows(self) -> None:
+        self._table_revision += 1
+        self._table_data.clear()
+        self._table_cells.clear()
+        self._table_col_widths[:] = [0] * len(self.TREE_COLUMNS)
+        self._table_col_widths_stale = False
+        for column in self._chain_columns.values():
+            column.clear()
+        self._idx_by_do.clear()
+
+    def _rebuild_table_index(self) -> None:
+        self._idx_by_do.clear()
+        columns = self._chain_columns
+        for index, key in enumerate(zip(columns["circuit"], columns["do"])):
+            self._idx_by_do.setdefault(key, []).append(index)
 
     def _sum_drop_for_circuit(self, circuit: str) -> float:
         if not circuit:
             return 0.0
-        total = 0.0
-        for row in self._table_data:
-            if row.get("Strujni krug", "").strip() == circuit:
-                try:
-                    total += float(str(row.get("ΔU %", "0")).replace(",", "."))
-                except (TypeError, ValueError):
-                    continue
-        return total
+        columns = self._chain_columns
+        return sum(
+            (drop for name, drop in zip(columns["circuit"], columns["drop"]) if name == circuit),
+            0.0,
+        )
 
     def _sum_drop_chain_ending_at(self, circuit: str, form_od: str) -> float:
         """Сумма ΔU % только по цепочке участков, продолжающейся до текущего: считаем строки таблицы,
@@ -1783,32 +2099,29 @@ class CableCalcApp(tk.Tk):
         form_do = do_var.get().strip() if do_var else ""
         form_l_norm = (length_var.get().strip().replace(",", ".") if length_var else "") or ""
         form_area_norm = (area_var.get().strip().replace(",", ".") if area_var else "") or ""
+        columns = self._chain_columns
+        ods, lengths, areas, drops = columns["od"], columns["length"], columns["area"], columns["drop"]
+        idx_by_do = self._idx_by_do
         total = 0.0
         visited = set()
         current = form_od.strip()
         while current and current not in visited:
             visited.add(current)
             found = None
-            for row in self._table_data:
-                if row.get("Strujni krug", "").strip() != circuit:
+            for index in idx_by_do.get((circuit, current), ()):
+                if (
+                    form_od == ods[index]
+                    and form_do == current
+                    and form_l_norm == lengths[index]
+                    and form_area_norm == areas[index]
+                ):
                     continue
-                row_do = str(row.get("DO", "")).strip()
-                if row_do != current:
-                    continue
-                row_od = str(row.get("OD", "")).strip()
-                row_l = str(row.get("L", "")).replace(",", ".").strip()
-                row_area = str(row.get("Presek", "")).replace(",", ".").strip()
-                if form_od == row_od and form_do == row_do and form_l_norm == row_l and form_area_norm == row_area:
-                    continue
-                found = row
+                found = index
                 break
-            if not found:
+            if found is None:
                 break
-            try:
-                total += float(str(found.get("ΔU %", "0")).replace(",", "."))
-            except (TypeError, ValueError):
-                pass
-            current = str(found.get("OD", "")).strip()
+            total += drops[found]
+            current = ods[found]
         return total
 
     def select_optimal_parameters(self) -> None:
@@ -1872,7 +2185,7 @@ class CableCalcApp(tk.Tk):
         s_coeff = self._lookup_group_factor(effective_circuits)
 
         pj = pi * kj
-        phase_factor = 2.0 if loaded_cores == 2 else math.sqrt(3)
+        phase_factor = 2.0 if loaded_cores == 2 else self.SQRT3
         denominator = phase_factor * voltage_value * cos_phi
         if not denominator:
             messagebox.showerror(self._("title.iec"), self._("error.division_zero"))
@@ -1894,7 +2207,7 @@ class CableCalcApp(tk.Tk):
             if not item:
                 continue
             try:
-                breaker_values.append((item, float(item.replace(",", "."))))
+                breaker_values.append((item, self._to_float(item)))
             except ValueError:
                 continue
 
@@ -1904,48 +2217,46 @@ class CableCalcApp(tk.Tk):
 
         insulation_key = insulation_meta["key"]
         insulation_theta = insulation_meta["theta"]
+        # voltage_value is non-zero here (checked through the denominator), so _drop_pct's zero-voltage guard is not needed.
+        sin_phi = _sin_phi(cos_phi)
+        # Breaker-only terms are the same for every section: skip non-positive ratings and compute I2 once.
+        breaker_plan = [
+            (breaker_str, breaker_value, breaker_value * k_value)
+            for breaker_str, breaker_value in breaker_values
+            if breaker_value > 0
+        ]
 
         success_combo: tuple[float, str, float, float] | None = None
         fallback_candidates: list[tuple[float, float, float, float, float, str]] = []
 
-        for area_candidate in self.STANDARD_SECTIONS:
-            if area_candidate <= 0:
-                continue
-            iz_base = self._lookup_ampacity(insulation_key, conductor, method, area_candidate, loaded_cores)
+        parallel_count = max(n_parallel, 1)
+        ampacity_row = self._ampacity_row(insulation_key, conductor, method, loaded_cores)
+        for area_candidate, iz_base in zip(self.STANDARD_SECTIONS, ampacity_row):
             if not iz_base:
                 continue
             iz_one = iz_base * s_coeff * t_coeff
-            iz_total = iz_one * max(n_parallel, 1)
+            iz_total = iz_one * parallel_count
             if iz_total <= 0:
                 continue
-            drop_val = self._drop_pct(
-                voltage_value,
-                cos_phi,
-                length,
-                conductor,
-                insulation_theta,
-                area_candidate,
-                method,
-                loaded_cores,
-                n_parallel,
-                icalc_total,
+            r_km, x_km = self._calculate_line_impedance(conductor, insulation_theta, area_candidate, method)
+            drop_val = _voltage_drop_pct(
+                phase_factor, icalc_total, r_km, x_km, n_parallel, cos_phi, sin_phi, length, voltage_value
             )
-            for breaker_str, breaker_value in breaker_values:
-                if breaker_value <= 0:
-                    continue
+            # Section-only terms, shared by every breaker tried below.
+            drop_ok = limit_pct is None or drop_val <= limit_pct
+            over_iz = max(0.0, icalc_total - iz_total)
+            over_drop = max(0.0, drop_val - (limit_pct or drop_val)) if limit_pct is not None else 0.0
+            i2_limit = 1.45 * iz_total
+            for breaker_str, breaker_value, i2_value in breaker_plan:
                 within_current = icalc_total <= breaker_value <= iz_total
-                drop_ok = limit_pct is None or drop_val <= limit_pct
-                i2_value = breaker_value * k_value
-                protection_ok = i2_value <= 1.45 * iz_total
+                protection_ok = i2_value <= i2_limit
                 if within_current and drop_ok and protection_ok:
                     success_combo = (area_candidate, breaker_str, iz_total, drop_val)
                     break
 
                 over_in_low = max(0.0, icalc_total - breaker_value)
                 over_in_high = max(0.0, breaker_value - iz_total)
-                over_iz = max(0.0, icalc_total - iz_total)
-                over_drop = max(0.0, drop_val - (limit_pct or drop_val)) if limit_pct is not None else 0.0
-                over_i2 = max(0.0, i2_value - 1.45 * iz_total)
+                over_i2 = max(0.0, i2_value - i2_limit)
                 metric = over_in_low + over_in_high + over_iz + over_drop + over_i2
                 fallback_candidates.append(
                     (
@@ -1975,8 +2286,8 @@ class CableCalcApp(tk.Tk):
             messagebox.showinfo(self._("title.iec"), self._("message.select_fail") + self._("message.no_combinations"))
             return
 
-        fallback_candidates.sort(key=lambda item: (item[0], item[1], item[2]))
-        top_items = fallback_candidates[:3]
+        # Only the three best misses are reported; nsmallest keeps sort order without sorting every candidate.
+        top_items = heapq.nsmallest(3, fallback_candidates, key=lambda item: (item[0], item[1], item[2]))
         lines: list[str] = []
         for metric, area_candidate, breaker_value, drop_val, iz_total, breaker_str in top_items:
             digits = 0 if float(area_candidate).is_integer() else 1
@@ -2007,12 +2318,12 @@ class CableCalcApp(tk.Tk):
         if not selected:
             return
         indexed = sorted((self.tree.index(item), item) for item in selected)
-        for _, item in indexed:
-            self.tree.delete(item)
+        self.tree.delete(*selected)
         for index, _ in reversed(indexed):
             if 0 <= index < len(self._table_data):
-                del self._table_data[index]
-        self._update_intermediate_results()
+                self._delete_table_row(index)
+        self._rebuild_table_index()
+        self._schedule_intermediate_update()
 
     def load_selected_row(self) -> None:
         if not hasattr(self, "tree"):
@@ -2025,61 +2336,34 @@ class CableCalcApp(tk.Tk):
             return
         row = self._table_data[row_index]
 
-        self._loading_row_into_form = True
-        field_map = {
-            "Strujni krug": "Strujni krug",
-            "Deonica OD": "OD",
-            "Deonica DO": "DO",
-            "Tip-IZOLACIJE": "E",
-            "Tip-PROVODNIKA": "F",
-            "Oznaka-tip-KABLA": "G",
-            "Pi, W": "Pi",
-            "Kj": "Kj",
-            "η": "η",
-            "U": "U",
-            "cos φ": "cosφ",
-            "Dužina L, m": "L",
-            "Presek, mm²": "Presek",
-            "Način polaganja": "Način polaganja",
-            "Нагруженные жилы (nž)": "nž",
-            "Кабелей в группе (для S)": "Кабелей в группе (S)",
-            "Параллельные кабели (n∥)": "n∥",
-            "In, A": "In [A]",
-            "k": "k",
-            "Ключ ΔU": "Ключ",
-        }
-
         current_insulation = self._form_values.get("Tip-IZOLACIJE")
         current_insulation_value = current_insulation.get() if current_insulation else ""
 
-        for field, column in field_map.items():
-            if field not in self._form_values:
-                continue
-            value = str(row.get(column, ""))
-            if field == "Presek, mm²" and value:
-                numeric = self._try_parse_float(value)
-                if numeric is not None:
-                    value = str(int(numeric)) if float(numeric).is_integer() else str(numeric)
-            if field in {"Pi, W", "Kj", "η", "cos φ", "Dužina L, m"} and value:
-                numeric = self._try_parse_float(value)
-                if numeric is not None:
-                    value = str(numeric)
-            widget = self._input_widgets.get(field)
-            if isinstance(widget, ttk.Combobox):
-                current_values = list(widget.cget("values"))
-                if value and value not in current_values:
-                    current_values.append(value)
-                    widget.configure(values=current_values)
-                    self._combobox_values[field] = current_values
-            if field == "Tip-IZOLACIJE" and value:
-                if value in self.INSULATION_META:
-                    self._form_values[field].set(value)
+        with self._suspend_traces():
+            for field, column_index, var, is_combobox in self._load_field_plan:
+                value = row[column_index]
+                if field == "Presek, mm²" and value:
+                    numeric = self._try_parse_float(value)
+                    if numeric is not None:
+                        value = str(int(numeric)) if float(numeric).is_integer() else str(numeric)
+                if field in self.NUMERIC_FORM_FIELDS and value:
+                    numeric = self._try_parse_float(value)
+                    if numeric is not None:
+                        value = str(numeric)
+                if is_combobox:
+                    current_values = self._combobox_values[field]
+                    if value and value not in current_values:
+                        current_values += (value,)
+                        self._input_widgets[field].configure(values=current_values)
+                        self._combobox_values[field] = current_values
+                if field == "Tip-IZOLACIJE" and value:
+                    if value in self.INSULATION_META:
+                        var.set(value)
+                    else:
+                        var.set(current_insulation_value)
                 else:
-                    self._form_values[field].set(current_insulation_value)
-            else:
-                self._form_values[field].set(value)
+                    var.set(value)
 
-        self._loading_row_into_form = False
         self._update_intermediate_results()
 
     def add_row(self) -> None:
@@ -2144,9 +2428,9 @@ class CableCalcApp(tk.Tk):
         res = self._last_result
         limit_delta = self.DROP_LIMIT_KEYS.get(drop_key, 0.0)
         existing_drop = self._sum_drop_chain_ending_at(strujni_krug, od)
-        total_drop = existing_drop + res["delta_u"]
+        total_drop = existing_drop + res.delta_u
 
-        if res["ampacity_ok"] == "NE" or res["drop_ok"] == "NE":
+        if res.ampacity_ok == "NE" or res.drop_ok == "NE":
             rec_msg = (
                 self._intermediate_vars.get("Рекомендации").get()
                 if "Рекомендации" in self._intermediate_vars
@@ -2168,40 +2452,49 @@ class CableCalcApp(tk.Tk):
             "Pi": self._fmt(pi),
             "Kj": self._fmt(kj),
             "η": self._fmt(eta, digits=3),
-            "Pj": self._fmt(res["pj"]),
+            "Pj": self._fmt(res.pj),
             "U": voltage,
             "cosφ": self._fmt(cos_phi, digits=3),
             "L": self._fmt(length),
             "Presek": self._fmt(area),
             "Način polaganja": laying,
-            "S": self._fmt(res["s_coeff"]),
-            "T": self._fmt(res["t_coeff"]),
-            "In [A]": self._fmt(res["in_value"]) if res.get("in_value") is not None else "",
-            "k": self._fmt(res["k_value"]) if res.get("k_value") is not None else "",
-            "I2 [A]": self._fmt(res["i2_value"]) if res.get("i2_value") is not None else "",
-            "Icalc [A]": self._fmt(res["icalc_total"], digits=3),
-            "R_base [Ω/km]": self._fmt(res["r_per_km"], digits=3),
-            "ϭ": self._fmt(res["sigma"], digits=2) if res.get("sigma") is not None else "—",
-            "Iz [A]": self._fmt(res["iz_one"]) if res.get("iz_one") is not None else "—",
-            "ΔU %": self._fmt(res["delta_u"]),
+            "S": self._fmt(res.s_coeff),
+            "T": self._fmt(res.t_coeff),
+            "In [A]": self._fmt(res.in_value) if res.in_value is not None else "",
+            "k": self._fmt(res.k_value) if res.k_value is not None else "",
+            "I2 [A]": self._fmt(res.i2_value) if res.i2_value is not None else "",
+            "Icalc [A]": self._fmt(res.icalc_total, digits=3),
+            "R_base [Ω/km]": self._fmt(res.r_per_km, digits=3),
+            "ϭ": self._fmt(res.sigma, digits=2) if res.sigma is not None else "—",
+            "Iz [A]": self._fmt(res.iz_one) if res.iz_one is not None else "—",
+            "ΔU %": self._fmt(res.delta_u),
             "Ukupni ΔU %": self._fmt(total_drop),
             "Limit ΔU %": self._fmt(limit_delta),
-            "По току": res["ampacity_ok"],
-            "По ΔU": res["drop_ok"],
-            "Защита": res["protection_status"],
+            "По току": res.ampacity_ok,
+            "По ΔU": res.drop_ok,
+            "Защита": res.protection_status,
             "Ключ": drop_key,
-            "Совместимость IEC": res["compatibility_status"],
+            "Совместимость IEC": res.compatibility_status,
         }
 
-        values = [row_data[column] for column in self.TREE_COLUMNS]
+        values = self.TREE_ROW_VALUES(row_data)
         self.tree.insert("", tk.END, values=values)
-        self._table_data.append(row_data)
+        self._append_table_row(values)
+
+    def _freeze_tree(self) -> None:
+        """Take the table out of the layout so bulk changes are not redrawn row by row."""
+        self.tree.grid_remove()
+
+    def _thaw_tree(self) -> None:
+        # grid() without options restores the placement remembered by grid_remove().
+        self.tree.grid()
 
     def clear_table(self) -> None:
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self._table_data.clear()
-        self._update_intermediate_results()
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._clear_table_rows()
+        self._schedule_intermediate_update()
 
     def save_project(self) -> None:
         file_path = filedialog.asksaveasfilename(
@@ -2214,12 +2507,13 @@ class CableCalcApp(tk.Tk):
 
         data = {
             "form": {name: var.get() for name, var in self._form_values.items()},
-            "table": self._table_data,
+            "table": [dict(zip(self.TREE_COLUMNS, row)) for row in self._table_data],
         }
 
         try:
-            with open(file_path, "w", encoding="utf-8") as handle:
-                json.dump(data, handle, ensure_ascii=False, indent=2)
+            payload = _json_dumps(data)
+            with open(file_path, "wb") as handle:
+                handle.write(payload)
         except OSError as exc:
             messagebox.showerror(self._("title.error"), self._m("error.save_project_failed", exc))
             logging.error("Ошибка сохранения проекта '%s': %s", file_path, exc)
@@ -2236,8 +2530,8 @@ class CableCalcApp(tk.Tk):
             return
 
         try:
-            with open(file_path, "r", encoding="utf-8") as handle:
-                payload = json.load(handle)
+            with open(file_path, "rb") as handle:
+                payload = _json_loads(handle.read())
         except (OSError, json.JSONDecodeError) as exc:
             messagebox.showerror(self._("title.error"), self._m("error.load_project_failed", exc))
             logging.error("Ошибка загрузки проекта '%s': %s", file_path, exc)
@@ -2248,36 +2542,51 @@ class CableCalcApp(tk.Tk):
 
         self._loading_project = True
         try:
-            for name, value in form_data.items():
-                if name in self._form_values:
-                    if name == "Среда для Т":
-                        self._set_medium_from_value(str(value))
-                    else:
-                        self._form_values[name].set(str(value))
-                    widget = self._input_widgets.get(name)
-                    if isinstance(widget, ttk.Combobox):
-                        current_values = list(widget.cget("values"))
-                        display_value = str(value)
-                        if display_value not in current_values and display_value != "":
-                            current_values.append(display_value)
-                            widget.configure(values=current_values)
-                            self._combobox_values[name] = current_values
-
-            self.clear_table()
-
-            for row in table_data:
-                if not isinstance(row, dict):
-                    continue
-                normalized = {column: str(row.get(column, "")) for column in self.TREE_COLUMNS}
-                self._table_data.append(normalized)
-                values = [normalized[column] for column in self.TREE_COLUMNS]
-                self.tree.insert("", tk.END, values=values)
+            with self._suspend_traces():
+                for name, value in form_data.items():
+                    if name in self._form_values:
+                        if name == "Среда для Т":
+                            self._set_medium_from_value(str(value))
+                        else:
+                            self._form_values[name].set(str(value))
+                        widget = self._input_widgets.get(name)
+                        if isinstance(widget, ttk.Combobox):
+                            current_values = self._combobox_values[name]
+                            display_value = str(value)
+                            if display_value not in current_values and display_value != "":
+                                current_values += (display_value,)
+                                widget.configure(values=current_values)
+                                self._combobox_values[name] = current_values
+
+                self._freeze_tree()
+                try:
+                    self.clear_table()
+
+                    columns = self.TREE_COLUMNS
+                    for row in table_data:
+                        if not isinstance(row, dict):
+                            continue
+                        values = [str(row.get(column, "")) for column in columns]
+                        self._append_table_row(values)
+                        self.tree.insert("", tk.END, values=values)
+                finally:
+                    self._thaw_tree()
 
             self._loading_project = False
             self._update_intermediate_results()
         finally:
             self._loading_project = False
 
+    def _export_col_widths(self) -> list[int]:
+        """Per-column data width maxima, recomputed first if rows were deleted since the last call."""
+        if self._table_col_widths_stale:
+            widths = [0] * len(self.TREE_COLUMNS)
+            for cells in self._table_cells:
+                widths[:] = map(max, widths, map(_cell_width, cells))
+            self._table_col_widths[:] = widths
+            self._table_col_widths_stale = False
+        return self._table_col_widths
+
     def export_to_excel(self) -> None:
         if not self._table_data:
             messagebox.showinfo(self._("title.export"), self._("message.export_no_data"))
@@ -2292,84 +2601,23 @@ class CableCalcApp(tk.Tk):
             return
 
         try:
-            self._write_workbook(file_path)
+            if xlsxwriter is not None and len(self._table_cells) >= self.XLSXWRITER_MIN_ROWS:
+                self._write_workbook_xlsxwriter(file_path)
+            else:
+                self._write_workbook(file_path)
             messagebox.showinfo(self._("title.export"), self._("message.export_ok"))
         except (OSError, ValueError) as exc:
             messagebox.showerror(self._("title.error"), self._m("error.export_failed", exc))
             logging.error("Ошибка экспорта Excel '%s': %s", file_path, exc)
 
-    def _write_workbook(self, file_path: str) -> None:
-        workbook = Workbook()
-        worksheet = workbook.active
-        worksheet.title = "Proračuni"
-
-        num_cols = len(self.TREE_COLUMNS)
-        lang = self._language.get()
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        header_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-
-        row_num = 1
-        title_cell = worksheet.cell(row=row_num, column=1, value=self._("export.doc_title"))
-        title_cell.font = Font(bold=True, size=14)
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-        if num_cols > 1:
-            worksheet.merge_cells(start_row=row_num, start_column=1, end_row=row_num, end_column=num_cols)
-        row_num += 1
-
-        subtitle_cell = worksheet.cell(row=row_num, column=1, value=self._("export.subtitle"))
-        subtitle_cell.font = Font(bold=True, size=11)
-        if num_cols > 1:
-            worksheet.merge_cells(start_row=row_num, start_column=1, end_row=row_num, end_column=num_cols)
-        row_num += 1
-
-        date_cell = worksheet.cell(row=row_num, column=1, value=datetime.now().strftime("%d.%m.%Y"))
-        date_cell.font = Font(italic=True)
-        row_num += 1
-
-        std_cell = worksheet.cell(row=row_num, column=1, value=self._("export.standard"))
-        std_cell.alignment = Alignment(wrap_text=True)
-        std_cell.font = Font(size=9)
-        if num_cols > 1:
-            worksheet.merge_cells(start_row=row_num, start_column=1, end_row=row_num, end_column=num_cols)
-        row_num += 2
-
-        table_header_row = row_num
+    def _export_labels(self) -> tuple[list[str], list[str]]:
+        """Translated header row and legend lines for the active language, built once per language."""
+        lang = self._active_lang
+        cached = self._export_label_cache.get(lang)
+        if cached is not None:
+            return cached
         header_row = [self._(self.TREE_COLUMN_KEYS.get(col, col)) for col in self.TREE_COLUMNS]
-        for col_idx, value in enumerate(header_row, start=1):
-            cell = worksheet.cell(row=table_header_row, column=col_idx, value=value)
-            cell.font = Font(bold=True)
-            cell.fill = header_fill
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        row_num += 1
-
-        for row in self._table_data:
-            for col_idx, column in enumerate(self.TREE_COLUMNS, start=1):
-                raw = row.get(column, "")
-                if isinstance(raw, (int, float)):
-                    cell_val: typing.Any = raw
-                else:
-                    text = str(raw)
-                    number = self._try_parse_float(text)
-                    cell_val = number if number is not None and text.strip() not in {"", "—"} else text
-                cell = worksheet.cell(row=row_num, column=col_idx, value=cell_val)
-                cell.border = thin_border
-            row_num += 1
-
-        data_end_row = row_num - 1
-        worksheet.auto_filter.ref = f"A{table_header_row}:{get_column_letter(num_cols)}{data_end_row}"
-        worksheet.freeze_panes = f"A{table_header_row + 1}"
-
-        row_num += 1
-        legend_title_cell = worksheet.cell(row=row_num, column=1, value=self._("export.legend_title"))
-        legend_title_cell.font = Font(bold=True, size=11)
-        row_num += 1
-
+        legend_lines: list[str] = []
         for col in self.TREE_COLUMNS:
             key = self.TREE_COLUMN_KEYS.get(col, col)
             label = self._(key)
@@ -2380,20 +2628,131 @@ class CableCalcApp(tk.Tk):
             else:
                 desc = self._(desc_key)
             if desc:
-                legend_cell = worksheet.cell(row=row_num, column=1, value=f"{label} — {desc}")
-                legend_cell.alignment = Alignment(wrap_text=False)
-                row_num += 1
-
-        for col_idx in range(1, num_cols + 1):
-            max_length = 12
-            for r in range(table_header_row, data_end_row + 1):
-                cell = worksheet.cell(row=r, column=col_idx)
-                if cell.value is not None:
-                    max_length = max(max_length, min(len(str(cell.value)) + 2, 50))
-            worksheet.column_dimensions[get_column_letter(col_idx)].width = max_length
+                legend_lines.append(f"{label} — {desc}")
+        cached = self._export_label_cache[lang] = (header_row, legend_lines)
+        return cached
+
+    def _write_workbook(self, file_path: str) -> None:
+        # Write-only workbook streams rows straight to the XML writer instead of
+        # keeping a full cell model in memory. Column widths and frozen panes are
+        # part of the sheet header, so they must be set before the first append.
+        workbook = Workbook(write_only=True)
+        workbook.add_named_style(NamedStyle(name=_DATA_CELL_STYLE, border=_THIN_BORDER))
+        worksheet = workbook.create_sheet("Proračuni")
+
+        num_cols = len(self.TREE_COLUMNS)
+        last_col = get_column_letter(num_cols)
+
+        def styled(value: typing.Any, **styles: typing.Any) -> WriteOnlyCell:
+            cell = WriteOnlyCell(worksheet, value=value)
+            for name, style in styles.items():
+                setattr(cell, name, style)
+            return cell
+
+        header_row, legend_lines = self._export_labels()
+        data_rows = self._table_cells
+
+        header_widths = [max(12, _cell_width(value)) for value in header_row]
+        col_widths = map(max, header_widths, self._export_col_widths())
+        for col_idx, width in enumerate(col_widths, start=1):
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+
+        table_header_row = 6
+        data_end_row = table_header_row + len(data_rows)
+        worksheet.freeze_panes = f"A{table_header_row + 1}"
+        worksheet.auto_filter.ref = f"A{table_header_row}:{last_col}{data_end_row}"
+        if num_cols > 1:
+            # A single-column sheet has nothing to merge; otherwise all title ranges are parsed in one go.
+            worksheet.merged_cells = MultiCellRange(" ".join(f"A{row}:{last_col}{row}" for row in (1, 2, 4)))
+
+        worksheet.append(
+            [
+                styled(self._("export.doc_title"), font=_TITLE_FONT, alignment=_TITLE_ALIGNMENT)
+            ]
+        )
+        worksheet.append([styled(self._("export.subtitle"), font=_SECTION_FONT)])
+        worksheet.append([styled(datetime.now().strftime("%d.%m.%Y"), font=_DATE_FONT)])
+        worksheet.append([styled(self._("export.standard"), alignment=_NOTE_ALIGNMENT, font=_NOTE_FONT)])
+        worksheet.append([])
+
+        worksheet.append(
+            [
+                styled(value, font=_HEADER_FONT, fill=_HEADER_FILL, border=_THIN_BORDER, alignment=_HEADER_ALIGNMENT)
+                for value in header_row
+            ]
+        )
+
+        for values in data_rows:
+            worksheet.append([styled(value, style=_DATA_CELL_STYLE) for value in values])
+
+        worksheet.append([])
+        worksheet.append([styled(self._("export.legend_title"), font=_SECTION_FONT)])
+
+        # Legend lines keep the default alignment, which does not wrap, so they need no styled cell.
+        for line in legend_lines:
+            worksheet.append([line])
 
         workbook.save(file_path)
 
+    def _write_workbook_xlsxwriter(self, file_path: str) -> None:
+        # Same sheet layout and cell styles as _write_workbook. constant_memory flushes every row as soon
+        # as the next one starts, so everything is written strictly top to bottom.
+        workbook = xlsxwriter.Workbook(file_path, {"constant_memory": True})
+        worksheet = workbook.add_worksheet("Proračuni")
+
+        num_cols = len(self.TREE_COLUMNS)
+        header_row, legend_lines = self._export_labels()
+        data_rows = self._table_cells
+
+        title_fmt = workbook.add_format({"bold": True, "font_size": 14, "align": "center", "valign": "vcenter"})
+        section_fmt = workbook.add_format({"bold": True, "font_size": 11})
+        date_fmt = workbook.add_format({"italic": True})
+        note_fmt = workbook.add_format({"font_size": 9, "text_wrap": True})
+        header_fmt = workbook.add_format(
+            {
+                "bold": True,
+                "bg_color": "#E0E0E0",
+                "border": 1,
+                "align": "center",
+                "valign": "vcenter",
+                "text_wrap": True,
+            }
+        )
+        data_fmt = workbook.add_format({"border": 1})
+
+        header_widths = [max(12, _cell_width(value)) for value in header_row]
+        for col_idx, width in enumerate(map(max, header_widths, self._export_col_widths())):
+            worksheet.set_column(col_idx, col_idx, width)
+
+        def full_width(row: int, text: str, fmt: typing.Any) -> None:
+            if num_cols > 1:
+                worksheet.merge_range(row, 0, row, num_cols - 1, text, fmt)
+            else:
+                worksheet.write(row, 0, text, fmt)
+
+        table_header_row = 5
+        data_end_row = table_header_row + len(data_rows)
+        worksheet.freeze_panes(table_header_row + 1, 0)
+        worksheet.autofilter(table_header_row, 0, data_end_row, num_cols - 1)
+
+        full_width(0, self._("export.doc_title"), title_fmt)
+        full_width(1, self._("export.subtitle"), section_fmt)
+        worksheet.write(2, 0, datetime.now().strftime("%d.%m.%Y"), date_fmt)
+        full_width(3, self._("export.standard"), note_fmt)
+        worksheet.write_row(table_header_row, 0, header_row, header_fmt)
+        for row_idx, values in enumerate(data_rows, start=table_header_row + 1):
+            worksheet.write_row(row_idx, 0, values, data_fmt)
+
+        legend_row = data_end_row + 2
+        worksheet.write(legend_row, 0, self._("export.legend_title"), section_fmt)
+        for row_idx, line in enumerate(legend_lines, start=legend_row + 1):
+            worksheet.write_string(row_idx, 0, line)
+
+        try:
+            workbook.close()
+        except xlsxwriter.exceptions.FileCreateError as exc:
+            raise OSError(str(exc)) from exc
+
 
 def main() -> None:
     app = CableCalcApp()